@@ -28,6 +28,8 @@ import queue
 from datetime import datetime, timedelta
 import os
 import sys
+import platform
+import subprocess
 from typing import Dict, List, Optional
 import json
 
@@ -46,6 +48,23 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Resolved once at import: how to hand a file/folder to the desktop shell
+_PLATFORM = platform.system()
+_OPENER = "open" if _PLATFORM == "Darwin" else "xdg-open"
+
+
+# Reports list label per file extension
+_REPORT_TYPES = {".pdf": "📄 PDF", ".txt": "📝 TXT", ".xlsx": "📊 Excel"}
+
+
+def open_path(path: str) -> None:
+    """Open a file or folder with the platform's default application"""
+    if _PLATFORM == "Windows":
+        os.startfile(path)
+    else:
+        subprocess.run([_OPENER, path], check=False)
+
+
 class TradingGUI:
     """Main GUI Application for Trading Sentiment Analysis"""
     
@@ -824,36 +843,30 @@ class TradingGUI:
             return
         
         try:
-            files = os.listdir(reports_dir)
+            # scandir reports file type and stat from the directory listing itself
+            with os.scandir(reports_dir) as entries:
+                files = sorted((e for e in entries if e.is_file()), key=lambda e: e.name)
             
-            for filename in sorted(files):
-                filepath = os.path.join(reports_dir, filename)
-                if os.path.isfile(filepath):
-                    # Get file stats
-                    stat = os.stat(filepath)
-                    size = f"{stat.st_size / 1024:.1f} KB"
-                    
-                    # Parse filename for info
-                    parts = filename.rsplit("_", 1)
-                    if len(parts) == 2:
-                        symbol = parts[0]
-                        date_str = parts[1].replace(".pdf", "").replace(".txt", "")
-                    else:
-                        symbol = "Unknown"
-                        date_str = "Unknown"
-                    
-                    # Determine file type
-                    if filename.endswith(".pdf"):
-                        file_type = "📄 PDF"
-                    elif filename.endswith(".txt"):
-                        file_type = "📝 TXT"
-                    elif filename.endswith(".xlsx"):
-                        file_type = "📊 Excel"
-                    else:
-                        file_type = "📁 File"
-                    
-                    self.reports_tree.insert("", tk.END, text=file_type, 
-                                           values=(filename, symbol, date_str, size))
+            for entry in files:
+                filename = entry.name
+                # Get file stats
+                stat = entry.stat()
+                size = f"{stat.st_size / 1024:.1f} KB"
+                
+                # Parse filename for info
+                parts = filename.rsplit("_", 1)
+                if len(parts) == 2:
+                    symbol = parts[0]
+                    date_str = parts[1].replace(".pdf", "").replace(".txt", "")
+                else:
+                    symbol = "Unknown"
+                    date_str = "Unknown"
+                
+                # Determine file type
+                file_type = _REPORT_TYPES.get(os.path.splitext(filename)[1], "📁 File")
+                
+                self.reports_tree.insert("", tk.END, text=file_type, 
+                                       values=(filename, symbol, date_str, size))
             
             self.log_message(f"Found {len(files)} files in {reports_dir}")
             
@@ -871,13 +884,7 @@ class TradingGUI:
         filepath = os.path.join(self.reports_dir_var.get(), filename)
         
         try:
-            import platform
-            if platform.system() == 'Darwin':  # macOS
-                os.system(f'open "{filepath}"')
-            elif platform.system() == 'Windows':
-                os.startfile(filepath)
-            else:  # Linux
-                os.system(f'xdg-open "{filepath}"')
+            open_path(filepath)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open report: {e}")
     
@@ -886,13 +893,7 @@ class TradingGUI:
         reports_dir = self.reports_dir_var.get()
         
         try:
-            import platform
-            if platform.system() == 'Darwin':  # macOS
-                os.system(f'open "{reports_dir}"')
-            elif platform.system() == 'Windows':
-                os.startfile(reports_dir)
-            else:  # Linux
-                os.system(f'xdg-open "{reports_dir}"')
+            open_path(reports_dir)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open folder: {e}")
     
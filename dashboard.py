@@ -43,6 +43,12 @@ except ImportError:
     print("❌ Error importing auto_retrain")
     raise
 
+try:
+    from log_store import write_log_mirror
+except ImportError:
+    print("❌ Error importing log_store")
+    raise
+
 try:
     from status_monitor import get_monitor, log_info, log_success, log_error, log_warning, log_data_fetch, log_analysis
 except ImportError:
@@ -533,6 +539,7 @@ class Dashboard:
             
             # Save to Excel
             df_combined.to_excel(self.excel_file, index=False)
+            write_log_mirror(df_combined, self.excel_file)
             print(f"\n📊 Saved {len(results)} entries to {self.excel_file}")
             
         except Exception as e:
@@ -604,7 +611,8 @@ class Dashboard:
                 verified_df = df[verified_mask]
                 
                 if not verified_df.empty:
-                    correct = (verified_df["Verified"] == "✅ True").sum()
+                    verified_df = verified_df.assign(_correct=verified_df["Verified"].eq("✅ True").to_numpy())
+                    correct = int(verified_df["_correct"].sum())
                     total_verified = len(verified_df)
                     accuracy = (correct / total_verified) * 100
                     
@@ -616,12 +624,14 @@ class Dashboard:
                     # By symbol
                     if "Symbol" in verified_df.columns:
                         print(f"\n   By Symbol:")
-                        for symbol in verified_df["Symbol"].unique():
-                            symbol_df = verified_df[verified_df["Symbol"] == symbol]
-                            symbol_correct = (symbol_df["Verified"] == "✅ True").sum()
-                            symbol_total = len(symbol_df)
-                            symbol_acc = (symbol_correct / symbol_total * 100) if symbol_total > 0 else 0
-                            print(f"      {symbol}: {symbol_acc:.1f}% ({symbol_correct}/{symbol_total})")
+                        symbol_stats = (
+                            verified_df
+                            .groupby("Symbol", sort=False)
+                            .agg(total=("_correct", "size"), correct=("_correct", "sum"))
+                        )
+                        for symbol, row in symbol_stats.iterrows():
+                            symbol_acc = row["correct"] / row["total"] * 100
+                            print(f"      {symbol}: {symbol_acc:.1f}% ({row['correct']}/{row['total']})")
             
             # Latest entries
             print(f"\n📋 Last 5 Predictions:")
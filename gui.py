@@ -1,12 +1,23 @@
 import os
 import io
+import re
 import contextlib
+import functools
+import stat
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Optional, Dict
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
+try:
+    from openpyxl import load_workbook
+except ImportError:
+    load_workbook = None
+
 # Make Streamlit optional at import-time to avoid hard failures during checks
 try:
     import streamlit as st  # type: ignore
@@ -20,10 +31,107 @@ except Exception:
             )
     st = _StreamlitStub()  # type: ignore
 
+
+def _fragment(fn):
+    """Wrap fn in st.fragment when the installed Streamlit supports it."""
+    if not STREAMLIT_AVAILABLE:
+        return fn
+    fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    return fragment(fn) if fragment else fn
+
+
+def _cache_data(**kwargs):
+    """st.cache_data that degrades to a plain function when Streamlit is missing."""
+    def decorate(fn):
+        if STREAMLIT_AVAILABLE:
+            return st.cache_data(**kwargs)(fn)
+        fn.clear = lambda *args, **kw: None
+        return fn
+    return decorate
+
+
+def _lazy_tabs(labels: List[str], key: str):
+    """st.tabs that reruns on switch so hidden tabs can skip their work."""
+    try:
+        return st.tabs(labels, key=key, on_change="rerun")
+    except TypeError:
+        return st.tabs(labels)
+
+
+def _lazy_expander(label: str, key: str):
+    """st.expander that reruns on toggle so a collapsed body can skip its work."""
+    try:
+        return st.expander(label, expanded=False, key=key, on_change="rerun")
+    except TypeError:
+        return st.expander(label, expanded=False)
+
+
+def _is_open(container) -> bool:
+    """True unless Streamlit reports the tab/expander as closed (older versions report nothing)."""
+    return getattr(container, "open", None) is not False
+
+# Client-side refresh timer for the status monitor (optional; falls back to sleep + rerun)
+try:
+    from streamlit_autorefresh import st_autorefresh
+except ImportError:
+    st_autorefresh = None
+
 # Local imports
 from dashboard import Dashboard
+from log_store import CATEGORY_COLUMNS, read_log, read_log_counts, fresh_parquet, count_rows
 from status_monitor import get_monitor, EventType
 
+# Event-log filter labels -> EventType (None means no filter)
+_FILTER_MAP = {
+    "All Events": None,
+    "Success": EventType.SUCCESS,
+    "Error": EventType.ERROR,
+    "Warning": EventType.WARNING,
+    "Data Fetch": EventType.DATA_FETCH,
+    "Analysis": EventType.ANALYSIS,
+    "Connection": EventType.CONNECTION,
+    "Info": EventType.INFO,
+    "Cache": EventType.CACHE
+}
+_FILTER_OPTIONS = tuple(_FILTER_MAP)
+
+# Activity statistics table: column label -> StatusMonitor.get_stats() key
+_STAT_COLUMNS = (
+    ("Total Events", "total_events"),
+    ("Successes", "successes"),
+    ("Failures", "failures"),
+    ("Warnings", "warnings"),
+    ("Data Fetches", "data_fetches"),
+    ("Analyses", "analyses")
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _exists(path: str) -> bool:
+    """os.path.exists memoized for one rerun; main() clears it at the top of every run."""
+    return os.path.exists(path)
+
+
+def _probe_access(path: str) -> Optional[Tuple[bool, bool]]:
+    """(readable, writable) from a single os.stat, or None when path does not exist."""
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    if not hasattr(os, "geteuid"):
+        # Windows only exposes the read-only attribute through st_mode
+        return True, bool(info.st_mode & stat.S_IWRITE)
+    euid = os.geteuid()
+    if euid == 0:
+        return True, True
+    if info.st_uid == euid:
+        read_bit, write_bit = stat.S_IRUSR, stat.S_IWUSR
+    elif info.st_gid == os.getegid() or info.st_gid in os.getgroups():
+        read_bit, write_bit = stat.S_IRGRP, stat.S_IWGRP
+    else:
+        read_bit, write_bit = stat.S_IROTH, stat.S_IWOTH
+    return bool(info.st_mode & read_bit), bool(info.st_mode & write_bit)
+
 
 def ensure_dashboard() -> Dashboard:
     """Create or fetch a persistent Dashboard instance in session state."""
@@ -32,8 +140,9 @@ def ensure_dashboard() -> Dashboard:
     return st.session_state.dashboard
 
 
-def render_status_monitor() -> None:
+def render_status_monitor(render_ts: Optional[str] = None) -> None:
     """Render real-time status monitor with event log and statistics"""
+    render_ts = render_ts or st.session_state.get("_render_ts") or datetime.now().strftime('%H:%M:%S')
     st.header("📊 Real-Time Application Status")
     
     monitor = get_monitor()
@@ -59,20 +168,12 @@ def render_status_monitor() -> None:
     st.subheader("📈 Activity Statistics")
     stats = monitor.get_stats()
     
-    col1, col2, col3, col4, col5, col6 = st.columns(6)
-    
-    with col1:
-        st.metric("Total Events", stats['total_events'])
-    with col2:
-        st.metric("Successes", stats['successes'], delta_color="normal")
-    with col3:
-        st.metric("Failures", stats['failures'], delta_color="inverse")
-    with col4:
-        st.metric("Warnings", stats['warnings'], delta_color="off")
-    with col5:
-        st.metric("Data Fetches", stats['data_fetches'])
-    with col6:
-        st.metric("Analyses", stats['analyses'])
+    # One single-row table instead of six metric widgets: one frontend delta per refresh
+    st.dataframe(
+        {label: [stats[key]] for label, key in _STAT_COLUMNS},
+        width='stretch',
+        hide_index=True
+    )
     
     st.markdown("---")
     
@@ -84,7 +185,7 @@ def render_status_monitor() -> None:
     with col_filter:
         filter_option = st.selectbox(
             "Filter by type",
-            ["All Events", "Success", "Error", "Warning", "Data Fetch", "Analysis", "Connection", "Info", "Cache"],
+            _FILTER_OPTIONS,
             index=0
         )
     
@@ -92,32 +193,18 @@ def render_status_monitor() -> None:
         event_count = st.number_input("Show last N events", min_value=10, max_value=500, value=100, step=10)
     
     # Get filtered events
-    filter_map = {
-        "All Events": None,
-        "Success": EventType.SUCCESS,
-        "Error": EventType.ERROR,
-        "Warning": EventType.WARNING,
-        "Data Fetch": EventType.DATA_FETCH,
-        "Analysis": EventType.ANALYSIS,
-        "Connection": EventType.CONNECTION,
-        "Info": EventType.INFO,
-        "Cache": EventType.CACHE
-    }
-    
-    event_type_filter = filter_map.get(filter_option)
-    events = monitor.get_filtered_events(event_type_filter, count=event_count)
+    event_type_filter = _FILTER_MAP.get(filter_option)
+    # One list per column: st.dataframe takes it as-is, no per-row dict inference
+    events = monitor.get_filtered_events_columnar(event_type_filter, count=event_count)
+    num_events = len(events["timestamp"])
     
     # Display events in a formatted table
-    if events:
-        st.markdown(f"**Showing {len(events)} most recent events** (newest first)")
-        
-        # Create DataFrame for better display
-        import pandas as pd
-        df_events = pd.DataFrame(events)
+    if num_events:
+        st.markdown(f"**Showing {num_events} most recent events** (newest first)")
         
         # Style the dataframe
         st.dataframe(
-            df_events,
+            events,
             column_config={
                 "timestamp": st.column_config.TextColumn("Time", width="small"),
                 "type": st.column_config.TextColumn("Type", width="small"),
@@ -129,14 +216,16 @@ def render_status_monitor() -> None:
             height=500
         )
         
-        # Detailed event view
-        with st.expander("📋 Detailed Event Log (Text Format)", expanded=False):
-            event_text = "\n".join([
-                f"[{e['timestamp']}] {e['type']} {e['message']}" + 
-                (f" - {e['details']}" if e['details'] else "")
-                for e in events
-            ])
-            st.text_area("", value=event_text, height=400, label_visibility="collapsed")
+        # Detailed event view; the text is only built while the expander is open
+        with _lazy_expander("📋 Detailed Event Log (Text Format)", key="status_event_text") as event_log:
+            if _is_open(event_log):
+                event_text = "\n".join([
+                    f"[{ts}] {kind} {message}" + (f" - {details}" if details else "")
+                    for ts, kind, message, details in zip(
+                        events["timestamp"], events["type"], events["message"], events["details"]
+                    )
+                ])
+                st.text_area("", value=event_text, height=400, label_visibility="collapsed")
     else:
         st.info("📝 No events logged yet. Events will appear here as the application runs.")
     
@@ -144,20 +233,24 @@ def render_status_monitor() -> None:
     st.markdown("---")
     
     if auto_refresh:
-        st.caption(f"🕒 Last updated: {datetime.now().strftime('%H:%M:%S')} | Auto-refreshing every second...")
+        st.caption(f"🕒 Last updated: {render_ts} | Auto-refreshing every second...")
         
-        # Use a placeholder and auto-refresh with JavaScript
-        # This is a more efficient approach than using time.sleep + st.rerun
-        import time
-        time.sleep(1)
-        st.rerun()
+        # The browser-side timer triggers the rerun, so the script thread never blocks
+        if st_autorefresh is not None:
+            st_autorefresh(interval=1000, key="status_monitor_refresh")
+        else:
+            time.sleep(1)
+            st.rerun()
     else:
-        st.caption(f"🕒 Last updated: {datetime.now().strftime('%H:%M:%S')} | Auto-refresh disabled. Click 'Refresh Now' to update manually.")
+        st.caption(f"🕒 Last updated: {render_ts} | Auto-refresh disabled. Click 'Refresh Now' to update manually.")
+
+
+# Commas, newlines, semicolons and tabs all separate symbols in the text area
+_SYM_SEP = re.compile(r"[,\n\r\t;]+")
 
 
 def parse_symbols(input_text: str) -> List[str]:
-    symbols = [s.strip() for s in input_text.replace("\n", ",").split(",") if s.strip()]
-    return symbols
+    return [s for s in (t.strip() for t in _SYM_SEP.split(input_text)) if s]
 
 
 def capture_output(fn, *args, **kwargs) -> Tuple[Optional[object], str, Optional[BaseException]]:
@@ -176,6 +269,8 @@ def capture_output(fn, *args, **kwargs) -> Tuple[Optional[object], str, Optional
 
 def get_mt5_status(dashboard: Dashboard) -> Dict:
     """Get MT5 connection status and details"""
+    # DataManager tracks the connection in memory (set by connect/disconnect), so this
+    # never talks to the terminal and is safe to call on the render thread
     try:
         is_connected = dashboard.data_manager.is_connected()
         use_mt5 = dashboard.data_manager.use_mt5
@@ -197,29 +292,128 @@ def get_mt5_status(dashboard: Dashboard) -> Dict:
         }
 
 
+MT5_STATUS_TTL = 5
+
+
+@_cache_data(show_spinner=False, ttl=MT5_STATUS_TTL)
+def _cached_mt5_status(dashboard_id: int, _dashboard: Dashboard) -> Dict:
+    """get_mt5_status shared by every render for MT5_STATUS_TTL seconds; keyed on id(dashboard)."""
+    return get_mt5_status(_dashboard)
+
+
+def mt5_status(dashboard: Dashboard) -> Dict:
+    """Recent MT5 status snapshot; connect/disconnect handlers clear it."""
+    return _cached_mt5_status(id(dashboard), dashboard)
+
+
+# MT5 badge per status tag: (icon, Streamlit alert level, label)
+_MT5_STATE = {
+    "error": ("🔴", "error", "Error"),
+    "disabled": ("⚠️", "warning", "Disabled"),
+    "connected": ("🟢", "success", "Connected"),
+    "down": ("🟡", "warning", "Disconnected"),
+}
+
+
+def _mt5_state(status: Dict) -> str:
+    """Map a get_mt5_status dict to its _MT5_STATE key."""
+    if status.get('error'):
+        return "error"
+    if not status['enabled']:
+        return "disabled"
+    return "connected" if status['connected'] else "down"
+
+
+def _render_mt5_badge(status: Dict) -> None:
+    """Show the MT5 status as a single alert box."""
+    icon, level, label = _MT5_STATE[_mt5_state(status)]
+    getattr(st, level)(f"{icon} **MT5 Status:** {label}")
+
+
+@_fragment
+def mt5_status_badge(dashboard: Dashboard) -> None:
+    """Render the MT5 status badge shared by the connection card and Home tab"""
+    status = mt5_status(dashboard)
+    _render_mt5_badge(status)
+
+
+# Directory listings are keyed on mtime; the TTL only evicts superseded entries
+REPORT_CACHE_TTL = 30
+
+
+@_cache_data(show_spinner=False, ttl=REPORT_CACHE_TTL)
+def _list_reports_count(report_dir: str, mtime_ns: int) -> int:
+    """Count report files; keyed on the directory mtime so unchanged dirs skip the scan."""
+    with os.scandir(report_dir) as entries:
+        return sum(1 for entry in entries if entry.is_file())
+
+
+def count_reports(report_dir: str = "reports") -> int:
+    """Return the number of report files in report_dir (0 when it does not exist)."""
+    try:
+        return _list_reports_count(report_dir, os.stat(report_dir).st_mtime_ns)
+    except OSError:
+        return 0
+
+
+@_cache_data(show_spinner=False, ttl=REPORT_CACHE_TTL)
+def _scan_reports(report_dir: str, mtime_ns: int) -> List[Tuple[str, float, int]]:
+    """One scandir pass returning (name, mtime, size) for each report, newest first."""
+    reports = []
+    with os.scandir(report_dir) as entries:
+        for entry in entries:
+            if entry.is_file():
+                info = entry.stat()
+                reports.append((entry.name, info.st_mtime, info.st_size))
+    reports.sort(key=lambda r: r[1], reverse=True)
+    return reports
+
+
+@_cache_data(show_spinner=False, ttl=REPORT_CACHE_TTL)
+def _list_reports(report_dir: str, mtime_ns: int) -> List[str]:
+    """Report file names in reverse name order; keyed on the directory mtime."""
+    with os.scandir(report_dir) as entries:
+        return sorted((entry.name for entry in entries if entry.is_file()), reverse=True)
+
+
+def scan_reports(report_dir: str = "reports") -> List[Tuple[str, float, int]]:
+    """Return cached (name, mtime, size) tuples for report_dir, newest first."""
+    try:
+        return _scan_reports(report_dir, os.stat(report_dir).st_mtime_ns)
+    except OSError:
+        return []
+
+
+# Help text lives in help/<slug>.md and is read only when a section renders
+HELP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "help")
+
+
+@_cache_data(show_spinner=False)
+def load_help(slug: str) -> str:
+    """Return help/<slug> (".md" appended when there is no extension), read once per process."""
+    if not os.path.splitext(slug)[1]:
+        slug += ".md"
+    with open(os.path.join(HELP_DIR, slug), encoding="utf-8") as f:
+        return f.read()
+
+
 def render_mt5_connection_card(dashboard: Dashboard) -> None:
     """Render MT5 connection status card with controls"""
-    mt5_status = get_mt5_status(dashboard)
+    status = mt5_status(dashboard)
     
     # Connection Status Header
     col1, col2, col3 = st.columns([2, 1, 1])
     
     with col1:
-        if mt5_status.get('error'):
-            st.error("🔴 **MT5 Status:** Error")
-        elif not mt5_status['enabled']:
-            st.warning("⚠️ **MT5 Status:** Disabled")
-        elif mt5_status['connected']:
-            st.success("🟢 **MT5 Status:** Connected")
-        else:
-            st.warning("🟡 **MT5 Status:** Disconnected")
+        mt5_status_badge(dashboard)
     
     with col2:
-        if mt5_status['enabled'] and not mt5_status['connected']:
+        if status['enabled'] and not status['connected']:
             if st.button("🔌 Connect MT5", width='stretch', type="primary"):
                 with st.spinner("Connecting to MT5..."):
                     try:
                         success = dashboard.data_manager.connect()
+                        _cached_mt5_status.clear()
                     except Exception as e:
                         st.error(f"❌ Connection error: {str(e)}")
                         success = False
@@ -230,57 +424,208 @@ def render_mt5_connection_card(dashboard: Dashboard) -> None:
                     st.error("❌ Connection failed - Check troubleshooting below")
     
     with col3:
-        if mt5_status['connected']:
+        if status['connected']:
             if st.button("🔌 Disconnect", width='stretch'):
                 dashboard.data_manager.disconnect()
+                _cached_mt5_status.clear()
                 st.info("Disconnected from MT5")
                 st.rerun()
+        if st.button("🔄 Refresh Status", width='stretch'):
+            _cached_mt5_status.clear()
+            st.rerun()
     
     # Connection Details
-    if mt5_status['enabled']:
+    if status['enabled']:
         with st.expander("📋 MT5 Connection Details", expanded=False):
             col_a, col_b = st.columns(2)
             with col_a:
-                st.text(f"Login: {mt5_status['login']}")
-                st.text(f"Server: {mt5_status['server']}")
+                st.text(f"Login: {status['login']}\nServer: {status['server']}")
             with col_b:
-                st.text(f"Enabled: {'Yes' if mt5_status['enabled'] else 'No'}")
-                st.text(f"Status: {'Connected' if mt5_status['connected'] else 'Disconnected'}")
+                st.text("\n".join([
+                    f"Enabled: {'Yes' if status['enabled'] else 'No'}",
+                    f"Status: {'Connected' if status['connected'] else 'Disconnected'}",
+                ]))
         
         # Troubleshooting section - only show if not connected
-        if not mt5_status['connected']:
+        if not status['connected']:
             with st.expander("🔧 Troubleshooting - Connection Issues", expanded=False):
-                st.markdown("""
-                **If connection gets stuck or fails:**
-                
-                1. **Check MT5 Terminal is Running**
-                   - Open MetaTrader 5 desktop application
-                   - Make sure you're logged in
-                   
-                2. **Verify Credentials**
-                   - Login: {login}
-                   - Server: {server}
-                   - Check these match your MT5 terminal
-                   
-                3. **Restart MT5 Terminal**
-                   - Close MetaTrader 5 completely
-                   - Wait 5 seconds
-                   - Reopen and login
-                   - Try connecting again
-                   
-                4. **Check Terminal Path**
-                   - Default: `C:\\Program Files\\MetaTrader 5\\terminal64.exe`
-                   - Set MT5_PATH environment variable if different
-                   
-                5. **Enable Algo Trading**
-                   - In MT5: Tools → Options → Expert Advisors
-                   - Check "Allow automated trading"
-                   - Check "Allow DLL imports"
-                """.format(login=mt5_status['login'], server=mt5_status['server']))
+                st.markdown(load_help("mt5_troubleshooting").format(login=status['login'], server=status['server']))
                 
                 st.info("💡 **Tip:** Most connection issues are fixed by restarting MT5 terminal")
 
 
+# Seconds a health check result is shown before it is refreshed automatically
+HEALTH_CHECK_TTL = 60
+
+# Columns the GUI tables and metrics actually read from the sentiment log
+LOG_COLUMNS = ("Date", "Symbol", "Final Bias", "Confidence", "Verified", "Weighted Score")
+BIAS_ORDER = ("bullish", "bearish", "neutral")
+
+
+@_cache_data(show_spinner=False)
+def _load_log(path: str, mtime: float, size: int, columns: Optional[Tuple[str, ...]] = None) -> pd.DataFrame:
+    """Parse the sentiment log (newest Date first); cached until the file's mtime or size changes."""
+    df = read_log(path, columns)
+    if "Date" in df.columns:
+        # Sort once per log version so tables can just take head(n)
+        df = df.sort_values("Date", ascending=False, kind="mergesort", ignore_index=True)
+    # Low-cardinality labels: integer codes make eq/isin/groupby much cheaper.
+    # The Parquet mirror already stores them as categoricals; the workbook fallback needs the cast
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    return df
+
+
+@_cache_data(show_spinner=False)
+def _count_log_rows(path: str, mtime: float, size: int) -> int:
+    """Row count of the sentiment log (Parquet metadata or a single Excel column)."""
+    return count_rows(path)
+
+
+def count_log_rows(path: str) -> int:
+    """Cached row count of the sentiment log; 0 when it does not exist or is unreadable."""
+    try:
+        info = os.stat(path)
+        return _count_log_rows(path, info.st_mtime, info.st_size)
+    except Exception:
+        return 0
+
+
+def load_sentiment_log(path: str, columns: Optional[Tuple[str, ...]] = LOG_COLUMNS) -> pd.DataFrame:
+    """Load the sentiment log (Parquet mirror when fresh) through the mtime-keyed cache."""
+    info = os.stat(path)
+    return _load_log(path, info.st_mtime, info.st_size, columns)
+
+
+def verified_masks(verified: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """(correct, incorrect) boolean arrays for a Verified column, via category codes when categorical."""
+    if isinstance(verified.dtype, pd.CategoricalDtype):
+        codes = verified.cat.codes.to_numpy()
+        true_code, false_code = verified.cat.categories.get_indexer(["✅ True", "❌ False"])
+        # get_indexer returns -1 for an absent label, which is also the NaN code
+        return (
+            codes == true_code if true_code >= 0 else np.zeros(len(codes), dtype=bool),
+            codes == false_code if false_code >= 0 else np.zeros(len(codes), dtype=bool),
+        )
+    values = verified.to_numpy()
+    return values == "✅ True", values == "❌ False"
+
+
+def accuracy_by(verified_df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """Per-group Verified/Correct/Incorrect counts and Accuracy % in one groupby pass"""
+    if "_correct" not in verified_df.columns:
+        verified_df = verified_df.assign(_correct=verified_df["Verified"].eq("✅ True"))
+    stats = (
+        verified_df
+        .groupby(column, sort=True, observed=True)
+        .agg(Verified=("_correct", "size"), Correct=("_correct", "sum"))
+    )
+    stats["Incorrect"] = stats["Verified"] - stats["Correct"]
+    stats["Accuracy"] = stats["Correct"] / stats["Verified"] * 100
+    return stats
+
+
+@_cache_data(show_spinner=False)
+def _verification_stats(path: str, mtime: float, size: int) -> Dict:
+    """Aggregate verification metrics once per version of the sentiment log"""
+    df = _load_log(path, mtime, size, LOG_COLUMNS)
+    stats = {
+        "total": len(df),
+        "has_verified": "Verified" in df.columns,
+        "verified": 0,
+        "correct": 0,
+        "accuracy": None,
+        "by_symbol": None,
+        "by_bias": None,
+    }
+    if not stats["has_verified"]:
+        return stats
+    
+    # One explicit copy of just the columns the aggregations touch
+    needed = [c for c in ("Verified", "Symbol", "Final Bias") if c in df.columns]
+    correct_mask, incorrect_mask = verified_masks(df["Verified"])
+    mask = correct_mask | incorrect_mask
+    verified_df = df.loc[mask, needed].copy()
+    if verified_df.empty:
+        return stats
+    
+    # Compare the emoji labels once; every metric below reuses the boolean column
+    verified_df = verified_df.assign(_correct=correct_mask[mask])
+    correct = int(verified_df["_correct"].sum())
+    stats.update(
+        verified=len(verified_df),
+        correct=correct,
+        accuracy=correct / len(verified_df) * 100,
+    )
+    if "Symbol" in verified_df.columns:
+        stats["by_symbol"] = accuracy_by(verified_df, "Symbol")
+    if "Final Bias" in verified_df.columns:
+        # Lowercase once and let groupby partition; unexpected biases stay visible after the known ones
+        bias = verified_df["Final Bias"].astype("string").str.lower()
+        by_bias = accuracy_by(verified_df.assign(_bias=bias.to_numpy()), "_bias")
+        order = [b for b in BIAS_ORDER if b in by_bias.index]
+        order += [b for b in by_bias.index if b not in BIAS_ORDER]
+        stats["by_bias"] = by_bias.loc[order]
+    return stats
+
+
+def verification_stats(path: str) -> Optional[Dict]:
+    """Cached verification metrics for the sentiment log, or None when it does not exist."""
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    return _verification_stats(path, info.st_mtime, info.st_size)
+
+
+def _log_stats_streaming(path: str) -> Tuple[int, int, int]:
+    """Stream the sentiment log and return (total, correct, verified) without a DataFrame."""
+    counts = read_log_counts(path)
+    if counts is not None:
+        return counts["total"], counts["correct"], counts["verified"]
+    if load_workbook is None or fresh_parquet(path):
+        # Only the Verified column is parsed; its length is the row count
+        df = read_log(path, ("Verified",))
+        if "Verified" not in df.columns:
+            return count_rows(path), 0, 0
+        correct_mask, incorrect_mask = verified_masks(df["Verified"])
+        correct = int(np.count_nonzero(correct_mask))
+        return len(df), correct, correct + int(np.count_nonzero(incorrect_mask))
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return 0, 0, 0
+        col = header.index("Verified") if "Verified" in header else None
+        total = correct = verified = 0
+        for row in rows:
+            total += 1
+            value = row[col] if col is not None and col < len(row) else None
+            if value == "✅ True":
+                correct += 1
+                verified += 1
+            elif value == "❌ False":
+                verified += 1
+        return total, correct, verified
+    finally:
+        wb.close()
+
+
+@_cache_data(show_spinner=False)
+def _excel_stats(path: str, mtime: float, size: int) -> Tuple[int, int, int]:
+    """(total, correct, verified) computed once per version of the sentiment log"""
+    return _log_stats_streaming(path)
+
+
+def log_stats(path: str) -> Tuple[int, int, int]:
+    """Cached (total, correct, verified) for the sentiment log, keyed on its mtime."""
+    info = os.stat(path)
+    return _excel_stats(path, info.st_mtime, info.st_size)
+
+
 def render_system_metrics(dashboard: Dashboard) -> None:
     """Render system metrics in a card layout"""
     st.subheader("📊 System Metrics")
@@ -288,41 +633,20 @@ def render_system_metrics(dashboard: Dashboard) -> None:
     # Get metrics
     excel_file = getattr(dashboard, "excel_file", "sentiment_log.xlsx")
     
+    total_predictions, correct, verified = 0, 0, 0
+    if _exists(excel_file):
+        try:
+            total_predictions, correct, verified = log_stats(excel_file)
+        except Exception:
+            pass
+    accuracy = (correct / verified) * 100 if verified else 0
+    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        # Total predictions
-        if os.path.exists(excel_file):
-            try:
-                df = pd.read_excel(excel_file)
-                total_predictions = len(df)
-            except:
-                total_predictions = 0
-        else:
-            total_predictions = 0
-        
         st.metric("Total Predictions", total_predictions)
     
     with col2:
-        # Accuracy
-        if os.path.exists(excel_file):
-            try:
-                df = pd.read_excel(excel_file)
-                if "Verified" in df.columns:
-                    verified_mask = df["Verified"].isin(["✅ True", "❌ False"])
-                    verified_df = df[verified_mask]
-                    if not verified_df.empty:
-                        correct = (verified_df["Verified"] == "✅ True").sum()
-                        accuracy = (correct / len(verified_df)) * 100
-                    else:
-                        accuracy = 0
-                else:
-                    accuracy = 0
-            except:
-                accuracy = 0
-        else:
-            accuracy = 0
-        
         st.metric("Accuracy", f"{accuracy:.1f}%")
     
     with col3:
@@ -332,8 +656,7 @@ def render_system_metrics(dashboard: Dashboard) -> None:
     
     with col4:
         # MT5 Status
-        mt5_status = get_mt5_status(dashboard)
-        status_text = "🟢 Online" if mt5_status['connected'] else "🔴 Offline"
+        status_text = "🟢 Online" if mt5_status(dashboard)['connected'] else "🔴 Offline"
         st.metric("MT5 Connection", status_text)
 
 
@@ -341,12 +664,12 @@ def render_latest_log_table(excel_file: str) -> None:
     """Render latest sentiment log with improved styling"""
     st.subheader("📈 Recent Predictions")
     
-    if not os.path.exists(excel_file):
+    if not _exists(excel_file):
         st.info("📝 No sentiment log file found yet. Run an analysis first.")
         return
     
     try:
-        df = pd.read_excel(excel_file)
+        df = load_sentiment_log(excel_file)
         if df.empty:
             st.info("📝 Sentiment log is empty.")
             return
@@ -359,7 +682,7 @@ def render_latest_log_table(excel_file: str) -> None:
         
         # Display with better formatting
         st.dataframe(
-            df.tail(20)[display_cols],
+            df[display_cols].head(20),
             width='stretch',
             hide_index=True,
             height=400
@@ -369,6 +692,26 @@ def render_latest_log_table(excel_file: str) -> None:
         st.error(f"❌ Could not read {excel_file}: {e}")
 
 
+# Largest text-report preview shipped to the browser (characters)
+REPORT_PREVIEW_LIMIT = 200_000
+
+
+@_cache_data(show_spinner=False, max_entries=16)
+def _read_report_preview(path: str, mtime: float, size: int) -> str:
+    """Read at most REPORT_PREVIEW_LIMIT characters of a text report."""
+    with open(path, "r", encoding="utf-8", errors="replace") as fh:
+        text = fh.read(REPORT_PREVIEW_LIMIT + 1)
+    if len(text) > REPORT_PREVIEW_LIMIT:
+        text = text[:REPORT_PREVIEW_LIMIT] + "\n… [truncated, download for the full report]"
+    return text
+
+
+def _read_report_bytes(path: str) -> bytes:
+    """Read a report for download; handed to st.download_button so it only runs on click."""
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
 def render_reports_section(report_dir: str) -> None:
     """Render reports section with improved UI"""
     st.subheader("📄 Analysis Reports")
@@ -377,15 +720,25 @@ def render_reports_section(report_dir: str) -> None:
         st.info("📁 No reports directory yet. Reports will appear here after running analysis.")
         return
     
-    files = sorted(
-        [f for f in os.listdir(report_dir) if os.path.isfile(os.path.join(report_dir, f))],
-        reverse=True,
-    )
+    files = _list_reports(report_dir, os.stat(report_dir).st_mtime_ns)
     
     if not files:
         st.info("📁 No reports generated yet. Run an analysis to generate reports.")
         return
     
+    _reports_block(report_dir, files)
+
+
+@_fragment
+def _reports_block(report_dir: str, files: List[str]) -> None:
+    """Report filter, selector, download and preview; reruns on its own as a fragment"""
+    # Reports are named "<SYMBOL>_<date>_..."; derive the filter from the prefix in one vectorized pass
+    names = pd.Series(files, dtype="string")
+    symbols = sorted(names.str.split("_", n=1).str[0].unique().tolist())
+    symbol_filter = st.selectbox("Filter by symbol", ["All"] + symbols, key="reports_symbol_filter")
+    if symbol_filter != "All":
+        files = names[names.str.startswith(f"{symbol_filter}_")].tolist()
+    
     # Display report selector and download
     col1, col2 = st.columns([3, 1])
     
@@ -396,12 +749,10 @@ def render_reports_section(report_dir: str) -> None:
         if selection:
             path = os.path.join(report_dir, selection)
             try:
-                with open(path, "rb") as fh:
-                    data = fh.read()
                 mime = "application/pdf" if selection.lower().endswith(".pdf") else "text/plain"
                 st.download_button(
                     label="⬇️ Download",
-                    data=data,
+                    data=functools.partial(_read_report_bytes, path),
                     file_name=selection,
                     mime=mime,
                     width='stretch',
@@ -413,9 +764,8 @@ def render_reports_section(report_dir: str) -> None:
     if selection and selection.lower().endswith(".txt"):
         try:
             path = os.path.join(report_dir, selection)
-            with open(path, "rb") as fh:
-                data = fh.read()
-            text = data.decode("utf-8", errors="replace")
+            info = os.stat(path)
+            text = _read_report_preview(path, info.st_mtime, info.st_size)
             
             with st.expander("👁️ Preview Report", expanded=True):
                 st.text_area("", value=text, height=400, label_visibility="collapsed")
@@ -423,6 +773,78 @@ def render_reports_section(report_dir: str) -> None:
             st.error(f"❌ Preview failed: {e}")
 
 
+def quick_test_mt5(dashboard: Dashboard, status: Dict) -> Tuple[str, str]:
+    """Check (and if needed open) the MT5 connection; returns (st level, message)."""
+    if not status['enabled']:
+        return "warning", "MT5 disabled"
+    # The status snapshot was just taken; only reconnect when it says we are down
+    if status.get('connected'):
+        return "success", "✅ MT5 already connected"
+    connected = dashboard.data_manager.connect()
+    _cached_mt5_status.clear()
+    if connected:
+        return "success", "✅ Connected"
+    return "error", "❌ Failed"
+
+
+# Smallest probe that clears DataManager's 30-bar quality gate; 4 days of H1 spans any weekend
+DATA_PROBE_TIMEFRAME = "H1"
+DATA_PROBE_DAYS = 4
+
+
+def quick_test_data(dashboard: Dashboard) -> Tuple[str, str]:
+    """Fetch a small window of bars for the first tracked symbol."""
+    test_sym = dashboard.symbols[0] if dashboard.symbols else "GBPUSD"
+    df = dashboard.data_manager.fetch_ohlcv_for_timeframe(test_sym, DATA_PROBE_TIMEFRAME, lookback_days=DATA_PROBE_DAYS)
+    if df is not None and not df.empty:
+        return "success", f"✅ Got {len(df)} bars"
+    return "error", "❌ No data"
+
+
+def quick_test_files(path_access: Dict[str, Optional[Tuple[bool, bool]]], excel_file: str) -> Tuple[str, str]:
+    """Check the probed paths are readable and writable; the sentiment log must exist."""
+    issues = [] if path_access.get(excel_file) is not None else [f"{excel_file} missing"]
+    for path, access in path_access.items():
+        if access is None:
+            continue
+        readable, writable = access
+        if not readable:
+            issues.append(f"{path} not readable")
+        if not writable:
+            issues.append(f"{path} not writable")
+    if issues:
+        return "warning", "⚠️ Issues: " + ", ".join(issues)
+    return "success", "✅ All OK"
+
+
+def _guarded_test(test, *args) -> Tuple[str, str]:
+    """Run one quick test, turning an exception into an error result."""
+    try:
+        return test(*args)
+    except Exception as e:
+        return "error", f"❌ {e}"
+
+
+def run_quick_tests(dashboard: Dashboard, status: Dict,
+                    path_access: Dict[str, Optional[Tuple[bool, bool]]], excel_file: str) -> Dict[str, Tuple[str, str]]:
+    """Run the three quick tests; the file check overlaps the MT5 and data tests."""
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        files = pool.submit(_guarded_test, quick_test_files, path_access, excel_file)
+        # The data probe needs the connection quick_test_mt5 may open, so these two run in order
+        results = {
+            "mt5": _guarded_test(quick_test_mt5, dashboard, status),
+            "data": _guarded_test(quick_test_data, dashboard),
+        }
+    results["files"] = files.result()
+    return results
+
+
+def show_test_result(result: Tuple[str, str]) -> None:
+    """Render a (level, message) quick-test result with st.success/warning/error."""
+    level, message = result
+    getattr(st, level)(message)
+
+
 def render_health_check(dashboard: Dashboard, show_logs: bool) -> None:
     """Render health check section"""
     st.subheader("🏥 System Health Check")
@@ -446,6 +868,104 @@ def render_health_check(dashboard: Dashboard, show_logs: bool) -> None:
                 st.text(out)
 
 
+@_fragment
+def render_health_tab(dashboard: Dashboard, excel_file: str, show_logs: bool) -> None:
+    """Health tab body; a fragment so its buttons rerun only this tab"""
+    st.header("🏥 System Health")
+    
+    # One stat per path serves both Component Status and Test Files
+    path_access = {path: _probe_access(path) for path in (excel_file, "reports", "config")}
+    excel_exists = path_access[excel_file] is not None
+    config_exists = path_access["config"] is not None
+    
+    col_h1, col_h2 = st.columns([2, 1])
+    with col_h1:
+        st.markdown("**Run comprehensive system health check**")
+    with col_h2:
+        run_health = st.button("🔍 Run Health Check", type="primary", use_container_width=True)
+    
+    # A click always re-runs the check; an earlier result is refreshed once it is
+    # older than HEALTH_CHECK_TTL and reused on other reruns
+    now = time.time()
+    if run_health or (
+        "health_result" in st.session_state
+        and now - st.session_state.get("health_ts", 0) > HEALTH_CHECK_TTL
+    ):
+        with st.spinner("Running health check..."):
+            ok, out, err = capture_output(dashboard.health_check)
+        st.session_state.update(health_ts=now, health_result=(ok, out, err))
+    
+    if "health_result" in st.session_state:
+        ok, out, err = st.session_state.health_result
+        st.caption(f"🕒 Checked at {datetime.fromtimestamp(st.session_state.health_ts).strftime('%H:%M:%S')}")
+        if err:
+            st.error("Health check failed")
+        elif ok:
+            st.success("All systems OK")
+        else:
+            st.warning("Some issues detected")
+        if show_logs and out:
+            with st.expander("Details", expanded=True):
+                st.text(out)
+    
+    st.markdown("---")
+    
+    st.subheader("🔧 Component Status")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("  \n".join([
+            "**Core**",
+            f"{'✅' if dashboard else '❌'} Dashboard",
+            f"{'✅' if hasattr(dashboard, 'data_manager') else '❌'} Data Manager",
+            f"{'✅' if hasattr(dashboard, 'sentiment_engine') else '❌'} Sentiment Engine",
+        ]))
+    
+    with col2:
+        mt5_s = mt5_status(dashboard)
+        st.markdown("  \n".join([
+            "**Connections**",
+            f"{'✅' if mt5_s['connected'] else '❌'} MT5",
+            f"{'✅' if excel_exists else '❌'} Excel Log",
+            f"{'✅' if config_exists else '❌'} Config Dir",
+        ]))
+    
+    with col3:
+        st.markdown("  \n".join([
+            "**Modules**",
+            f"{'✅' if hasattr(dashboard, 'verifier') else '❌'} Verifier",
+            f"{'✅' if hasattr(dashboard, 'retrainer') else '❌'} Retrainer",
+            f"{'✅' if hasattr(dashboard, 'report_generator') else '❌'} Reports",
+        ]))
+    
+    st.markdown("---")
+    
+    st.subheader("⚡ Quick Tests")
+    results = {}
+    if st.button("🚀 Run All Tests", use_container_width=True):
+        with st.spinner("Running quick tests..."):
+            results = run_quick_tests(dashboard, mt5_s, path_access, excel_file)
+    col_t1, col_t2, col_t3 = st.columns(3)
+    
+    with col_t1:
+        if st.button("🔌 Test MT5", use_container_width=True):
+            results["mt5"] = quick_test_mt5(dashboard, mt5_s)
+        if "mt5" in results:
+            show_test_result(results["mt5"])
+    
+    with col_t2:
+        if st.button("📊 Test Data", use_container_width=True):
+            results["data"] = quick_test_data(dashboard)
+        if "data" in results:
+            show_test_result(results["data"])
+    
+    with col_t3:
+        if st.button("📄 Test Files", use_container_width=True):
+            results["files"] = quick_test_files(path_access, excel_file)
+        if "files" in results:
+            show_test_result(results["files"])
+
+
 def main() -> None:
     if not STREAMLIT_AVAILABLE:
         raise RuntimeError(
@@ -462,39 +982,19 @@ def main() -> None:
     )
     
     # Custom CSS for better styling
-    st.markdown("""
-    <style>
-        .main-header {
-            font-size: 2.5rem;
-            font-weight: bold;
-            color: #1f77b4;
-            margin-bottom: 1rem;
-        }
-        .section-header {
-            background: linear-gradient(90deg, #1f77b4 0%, #ff7f0e 100%);
-            padding: 0.5rem;
-            border-radius: 5px;
-            color: white;
-            margin-bottom: 1rem;
-        }
-        .stButton>button {
-            border-radius: 5px;
-            font-weight: 500;
-        }
-        .metric-card {
-            background-color: #f0f2f6;
-            padding: 1rem;
-            border-radius: 5px;
-            border-left: 4px solid #1f77b4;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(f"<style>{load_help('dashboard.css')}</style>", unsafe_allow_html=True)
     
     # Main header
     st.markdown('<div class="main-header">🤖 Trading Bot Dashboard</div>', unsafe_allow_html=True)
     st.markdown("*Automated trading sentiment analysis with MT5 integration*")
     
+    _exists.cache_clear()
     dashboard = ensure_dashboard()
+    excel_file = getattr(dashboard, "excel_file", "sentiment_log.xlsx")
+    
+    # One timestamp per rerun, shared by every "last updated" caption
+    render_ts = datetime.now().strftime('%H:%M:%S')
+    st.session_state["_render_ts"] = render_ts
     
     # ============================================================
     # SIDEBAR - Configuration & Settings
@@ -566,7 +1066,7 @@ def main() -> None:
             st.success("✅ Cache cleared")
         
         st.markdown("---")
-        st.caption(f"🕒 Last Updated: {datetime.now().strftime('%H:%M:%S')}")
+        st.caption(f"🕒 Last Updated: {render_ts}")
         st.caption("💡 Tip: Use `streamlit run gui.py` to launch")
     
     # ============================================================
@@ -590,13 +1090,13 @@ def main() -> None:
     # ============================================================
     # TABBED INTERFACE - 5 CLEAN TABS
     # ============================================================
-    tab_home, tab_analysis, tab_health, tab_retrain, tab_running_status = st.tabs([
+    tab_home, tab_analysis, tab_health, tab_retrain, tab_running_status = _lazy_tabs([
         "🏠 Home",
         "📊 Analysis",
         "🏥 Health",
         "🔄 Retrain",
         "📡 Running Status"
-    ])
+    ], key="main_tab")
     
     # ============================================================
     # TAB 1: HOME - ALL IMPORTANT INFO
@@ -633,8 +1133,11 @@ def main() -> None:
                 with st.spinner("Verifying..."):
                     _, out, err = capture_output(dashboard.run_verification)
                 if not err:
+                    # The tab sections below read the log after this point, so dropping the
+                    # verification caches is enough for them to show the new results
+                    _load_log.clear()
+                    _verification_stats.clear()
                     st.success("✅ Verified!")
-                    st.rerun()
         
         with col4:
             if st.button("🔄 Retrain Model", type="secondary", use_container_width=True):
@@ -650,84 +1153,55 @@ def main() -> None:
         st.subheader("📊 System Status")
         col1, col2, col3, col4, col5 = st.columns(5)
         
-        mt5_status = get_mt5_status(dashboard)
-        excel_file = getattr(dashboard, "excel_file", "sentiment_log.xlsx")
-        
         with col1:
-            if mt5_status['connected']:
-                st.metric("MT5", "🟢 Connected")
-            else:
-                st.metric("MT5", "🔴 Offline")
+            mt5_status_badge(dashboard)
+        
+        stats = verification_stats(excel_file)
         
         with col2:
-            if os.path.exists(excel_file):
-                df = pd.read_excel(excel_file)
-                st.metric("Predictions", len(df))
-            else:
-                st.metric("Predictions", 0)
+            st.metric("Predictions", count_log_rows(excel_file))
         
         with col3:
-            if os.path.exists(excel_file):
-                df = pd.read_excel(excel_file)
-                if "Verified" in df.columns:
-                    verified = df["Verified"].isin(["✅ True", "❌ False"]).sum()
-                    st.metric("Verified", verified)
-                else:
-                    st.metric("Verified", 0)
-            else:
-                st.metric("Verified", 0)
+            st.metric("Verified", stats["verified"] if stats else 0)
         
         with col4:
-            if os.path.exists(excel_file):
-                df = pd.read_excel(excel_file)
-                if "Verified" in df.columns:
-                    verified_df = df[df["Verified"].isin(["✅ True", "❌ False"])]
-                    if len(verified_df) > 0:
-                        acc = (verified_df["Verified"] == "✅ True").sum() / len(verified_df) * 100
-                        st.metric("Accuracy", f"{acc:.1f}%")
-                    else:
-                        st.metric("Accuracy", "N/A")
-                else:
-                    st.metric("Accuracy", "N/A")
+            if stats and stats["accuracy"] is not None:
+                st.metric("Accuracy", f"{stats['accuracy']:.1f}%")
             else:
                 st.metric("Accuracy", "N/A")
         
         with col5:
-            if os.path.exists("reports"):
-                reports = len([f for f in os.listdir("reports") if os.path.isfile(os.path.join("reports", f))])
-                st.metric("Reports", reports)
-            else:
-                st.metric("Reports", 0)
+            st.metric("Reports", count_reports("reports"))
         
         st.markdown("---")
         
         # Accuracy Metrics
         st.subheader("📈 Accuracy Breakdown")
-        if os.path.exists(excel_file):
-            df = pd.read_excel(excel_file)
-            if "Verified" in df.columns:
-                verified_df = df[df["Verified"].isin(["✅ True", "❌ False"])]
-                if not verified_df.empty:
-                    col_a, col_b = st.columns(2)
-                    with col_a:
-                        correct = (verified_df["Verified"] == "✅ True").sum()
-                        total = len(verified_df)
-                        acc = correct / total * 100
-                        st.progress(acc / 100)
-                        st.markdown(f"**{acc:.1f}%** overall ({correct}/{total})")
-                    
-                    with col_b:
-                        if "Symbol" in verified_df.columns:
-                            for sym in verified_df["Symbol"].unique():
-                                sym_df = verified_df[verified_df["Symbol"] == sym]
-                                sym_acc = (sym_df["Verified"] == "✅ True").sum() / len(sym_df) * 100
-                                st.text(f"{sym}: {sym_acc:.0f}%")
-                else:
-                    st.info("No verified predictions")
-            else:
-                st.info("No verification data")
-        else:
+        if stats is None:
             st.info("No data yet")
+        elif not stats["has_verified"]:
+            st.info("No verification data")
+        elif not stats["verified"]:
+            st.info("No verified predictions")
+        else:
+            col_a, col_b = st.columns(2)
+            with col_a:
+                acc = stats["accuracy"]
+                st.progress(acc / 100)
+                st.markdown(f"**{acc:.1f}%** overall ({stats['correct']}/{stats['verified']})")
+            
+            with col_b:
+                # One text element for the whole breakdown instead of one per line
+                lines = []
+                if stats["by_symbol"] is not None:
+                    lines += [f"{sym}: {sym_acc:.0f}%" for sym, sym_acc in stats["by_symbol"]["Accuracy"].items()]
+                if stats["by_bias"] is not None:
+                    lines += [
+                        f"{bias.title()}: {row['Accuracy']:.0f}% ({int(row['Correct'])}/{int(row['Verified'])})"
+                        for bias, row in stats["by_bias"].iterrows()
+                    ]
+                if lines:
+                    st.text("\n".join(lines))
         
         st.markdown("---")
         
@@ -753,11 +1227,11 @@ def main() -> None:
         
         # Recent Predictions Table
         st.subheader("📋 Recent Predictions")
-        if os.path.exists(excel_file):
-            df = pd.read_excel(excel_file)
+        if _exists(excel_file):
+            df = load_sentiment_log(excel_file)
             if not df.empty:
                 cols = [c for c in ["Date", "Symbol", "Final Bias", "Confidence", "Verified", "Weighted Score"] if c in df.columns]
-                st.dataframe(df[cols].tail(20).sort_values("Date", ascending=False), use_container_width=True, hide_index=True, height=400)
+                st.dataframe(df[cols].head(20), use_container_width=True, hide_index=True, height=400)
             else:
                 st.info("No predictions")
         else:
@@ -767,17 +1241,20 @@ def main() -> None:
         
         # Recent Reports
         st.subheader("📄 Recent Reports")
-        if os.path.exists("reports"):
-            files = sorted([f for f in os.listdir("reports") if os.path.isfile(os.path.join("reports", f))], 
-                          key=lambda x: os.path.getmtime(os.path.join("reports", x)), reverse=True)[:10]
+        if _exists("reports"):
+            files = [name for name, _, _ in scan_reports("reports")[:10]]
             if files:
                 for f in files:
                     col_r1, col_r2 = st.columns([3, 1])
                     with col_r1:
                         st.text(f"📄 {f}")
                     with col_r2:
-                        with open(os.path.join("reports", f), "rb") as fh:
-                            st.download_button("⬇️", fh.read(), file_name=f, key=f"dl_{f}")
+                        st.download_button(
+                            "⬇️",
+                            functools.partial(_read_report_bytes, os.path.join("reports", f)),
+                            file_name=f,
+                            key=f"dl_{f}",
+                        )
             else:
                 st.info("No reports")
         else:
@@ -793,9 +1270,9 @@ def main() -> None:
         st.markdown("---")
         
         st.subheader("📈 Analysis Summary")
-        excel_file = getattr(dashboard, "excel_file", "sentiment_log.xlsx")
-        if os.path.exists(excel_file):
-            df = pd.read_excel(excel_file)
+        # The log is only loaded once the tab is opened
+        if _is_open(tab_analysis) and _exists(excel_file):
+            df = load_sentiment_log(excel_file)
             if not df.empty:
                 # Summary metrics
                 col1, col2, col3, col4, col5 = st.columns(5)
@@ -813,13 +1290,9 @@ def main() -> None:
                     today_count = (df["Date"].astype(str).str.contains(today)).sum() if "Date" in df.columns else 0
                     st.metric("Today's Analyses", today_count)
                 with col5:
-                    if "Verified" in df.columns:
-                        verified_df = df[df["Verified"].isin(["✅ True", "❌ False"])]
-                        if len(verified_df) > 0:
-                            acc = (verified_df["Verified"] == "✅ True").sum() / len(verified_df) * 100
-                            st.metric("Accuracy", f"{acc:.1f}%")
-                        else:
-                            st.metric("Accuracy", "N/A")
+                    stats = verification_stats(excel_file)
+                    if stats and stats["accuracy"] is not None:
+                        st.metric("Accuracy", f"{stats['accuracy']:.1f}%")
                     else:
                         st.metric("Accuracy", "N/A")
                 
@@ -845,9 +1318,9 @@ def main() -> None:
                 # Display filtered results
                 cols = [c for c in ["Date", "Symbol", "Final Bias", "Confidence", "Weighted Score", "Verified"] if c in filt_df.columns]
                 if count_filter != "All":
-                    display_df = filt_df[cols].tail(count_filter).sort_values("Date", ascending=False)
+                    display_df = filt_df[cols].head(count_filter)
                 else:
-                    display_df = filt_df[cols].sort_values("Date", ascending=False)
+                    display_df = filt_df[cols]
                 
                 st.dataframe(display_df, use_container_width=True, hide_index=True, height=500)
                 
@@ -874,90 +1347,9 @@ def main() -> None:
     # TAB 3: HEALTH - DIAGNOSTICS
     # ============================================================
     with tab_health:
-        st.header("🏥 System Health")
-        
-        col_h1, col_h2 = st.columns([2, 1])
-        with col_h1:
-            st.markdown("**Run comprehensive system health check**")
-        with col_h2:
-            run_health = st.button("🔍 Run Health Check", type="primary", use_container_width=True)
-        
-        if run_health:
-            with st.spinner("Running health check..."):
-                ok, out, err = capture_output(dashboard.health_check)
-            if err:
-                st.error("Health check failed")
-            elif ok:
-                st.success("All systems OK")
-            else:
-                st.warning("Some issues detected")
-            if show_logs and out:
-                with st.expander("Details", expanded=True):
-                    st.text(out)
-        
-        st.markdown("---")
-        
-        st.subheader("🔧 Component Status")
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("**Core**")
-            st.text(f"{'✅' if dashboard else '❌'} Dashboard")
-            st.text(f"{'✅' if hasattr(dashboard, 'data_manager') else '❌'} Data Manager")
-            st.text(f"{'✅' if hasattr(dashboard, 'sentiment_engine') else '❌'} Sentiment Engine")
-        
-        with col2:
-            st.markdown("**Connections**")
-            mt5_s = get_mt5_status(dashboard)
-            st.text(f"{'✅' if mt5_s['connected'] else '❌'} MT5")
-            st.text(f"{'✅' if os.path.exists('sentiment_log.xlsx') else '❌'} Excel Log")
-            st.text(f"{'✅' if os.path.exists('config') else '❌'} Config Dir")
-        
-        with col3:
-            st.markdown("**Modules**")
-            st.text(f"{'✅' if hasattr(dashboard, 'verifier') else '❌'} Verifier")
-            st.text(f"{'✅' if hasattr(dashboard, 'retrainer') else '❌'} Retrainer")
-            st.text(f"{'✅' if hasattr(dashboard, 'report_generator') else '❌'} Reports")
-        
-        st.markdown("---")
-        
-        st.subheader("⚡ Quick Tests")
-        col_t1, col_t2, col_t3 = st.columns(3)
-        
-        with col_t1:
-            if st.button("🔌 Test MT5", use_container_width=True):
-                if mt5_s['enabled']:
-                    if dashboard.data_manager.is_connected():
-                        st.success("✅ Connected")
-                    else:
-                        connected = dashboard.data_manager.connect()
-                        if connected:
-                            st.success("✅ Connected")
-                        else:
-                            st.error("❌ Failed")
-                else:
-                    st.warning("MT5 disabled")
-        
-        with col_t2:
-            if st.button("📊 Test Data", use_container_width=True):
-                test_sym = dashboard.symbols[0] if dashboard.symbols else "GBPUSD"
-                df = dashboard.data_manager.fetch_ohlcv_for_timeframe(test_sym, "D1", lookback_days=5)
-                if df is not None and not df.empty:
-                    st.success(f"✅ Got {len(df)} bars")
-                else:
-                    st.error("❌ No data")
-        
-        with col_t3:
-            if st.button("📄 Test Files", use_container_width=True):
-                checks = []
-                if os.path.exists('sentiment_log.xlsx'):
-                    checks.append(("Excel readable", os.access('sentiment_log.xlsx', os.R_OK)))
-                    checks.append(("Excel writable", os.access('sentiment_log.xlsx', os.W_OK)))
-                all_ok = all(c[1] for c in checks) if checks else False
-                if all_ok:
-                    st.success("✅ All OK")
-                else:
-                    st.warning("⚠️ Issues")
+        # Path probes and MT5 status are skipped until the tab is opened
+        if _is_open(tab_health):
+            render_health_tab(dashboard, excel_file, show_logs)
     
     # ============================================================
     # TAB 4: RETRAIN - MODEL RETRAINING
@@ -966,34 +1358,28 @@ def main() -> None:
         st.header("🔄 Model Retraining")
         
         st.subheader("📊 Current Performance")
-        excel_file = getattr(dashboard, "excel_file", "sentiment_log.xlsx")
-        if os.path.exists(excel_file):
-            df = pd.read_excel(excel_file)
-            if "Verified" in df.columns:
-                verified_df = df[df["Verified"].isin(["✅ True", "❌ False"])]
-                if not verified_df.empty:
-                    correct = (verified_df["Verified"] == "✅ True").sum()
-                    total = len(verified_df)
-                    acc = correct / total * 100
-                    
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Accuracy", f"{acc:.1f}%")
-                    with col2:
-                        st.metric("Verified", total)
-                    with col3:
-                        st.metric("Correct", correct)
-                    
-                    if acc < 70:
-                        st.warning(f"⚠️ Accuracy ({acc:.1f}%) is below 70% - retraining recommended")
-                    else:
-                        st.success(f"✅ Accuracy ({acc:.1f}%) is good")
-                else:
-                    st.info("No verified predictions yet")
-            else:
-                st.info("No verification data")
-        else:
+        stats = verification_stats(excel_file) if _is_open(tab_retrain) else None
+        if stats is None:
             st.info("No data file")
+        elif not stats["has_verified"]:
+            st.info("No verification data")
+        elif not stats["verified"]:
+            st.info("No verified predictions yet")
+        else:
+            acc = stats["accuracy"]
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Accuracy", f"{acc:.1f}%")
+            with col2:
+                st.metric("Verified", stats["verified"])
+            with col3:
+                st.metric("Correct", stats["correct"])
+            
+            if acc < 70:
+                st.warning(f"⚠️ Accuracy ({acc:.1f}%) is below 70% - retraining recommended")
+            else:
+                st.success(f"✅ Accuracy ({acc:.1f}%) is good")
         
         st.markdown("---")
         
@@ -1001,12 +1387,7 @@ def main() -> None:
         col_r1, col_r2 = st.columns([2, 1])
         
         with col_r1:
-            st.markdown("""
-            **Retraining adjusts rule weights based on verified predictions**
-            - Improves accuracy over time
-            - Adapts to market conditions
-            - Run when accuracy < 70%
-            """)
+            st.markdown(load_help("retraining"))
         
         with col_r2:
             if st.button("▶️ Run Retraining", type="primary", use_container_width=True):
@@ -1024,7 +1405,7 @@ def main() -> None:
     # TAB 5: RUNNING STATUS - LIVE LOG
     # ============================================================
     with tab_running_status:
-        render_status_monitor()
+        render_status_monitor(render_ts)
 
 
 if __name__ == "__main__":
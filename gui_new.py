@@ -1,6 +1,9 @@
 import os
 import io
+import re
 import contextlib
+import functools
+import time
 import traceback
 from typing import List, Tuple, Optional, Dict
 from datetime import datetime
@@ -20,10 +23,64 @@ except Exception:
             )
     st = _StreamlitStub()  # type: ignore
 
+
+def _cache_data(**kwargs):
+    """st.cache_data that degrades to a plain function when Streamlit is missing."""
+    def decorate(fn):
+        if STREAMLIT_AVAILABLE:
+            return st.cache_data(**kwargs)(fn)
+        fn.clear = lambda *args, **kw: None
+        return fn
+    return decorate
+
+
+def _lazy_expander(label: str, key: str):
+    """st.expander that reruns on toggle so a collapsed body can skip its work."""
+    try:
+        return st.expander(label, expanded=False, key=key, on_change="rerun")
+    except TypeError:
+        return st.expander(label, expanded=False)
+
+
+def _is_open(container) -> bool:
+    """True unless Streamlit reports the tab/expander as closed (older versions report nothing)."""
+    return getattr(container, "open", None) is not False
+
+# Client-side refresh timer for the status monitor (optional; falls back to sleep + rerun)
+try:
+    from streamlit_autorefresh import st_autorefresh
+except ImportError:
+    st_autorefresh = None
+
 # Local imports
 from dashboard import Dashboard
+from log_store import CATEGORY_COLUMNS, read_log, read_log_tail
 from status_monitor import get_monitor, EventType
 
+# Event-log filter labels -> EventType (None means no filter)
+_FILTER_MAP = {
+    "All Events": None,
+    "Success": EventType.SUCCESS,
+    "Error": EventType.ERROR,
+    "Warning": EventType.WARNING,
+    "Data Fetch": EventType.DATA_FETCH,
+    "Analysis": EventType.ANALYSIS,
+    "Connection": EventType.CONNECTION,
+    "Info": EventType.INFO,
+    "Cache": EventType.CACHE
+}
+_FILTER_OPTIONS = tuple(_FILTER_MAP)
+
+# Activity statistics table: column label -> StatusMonitor.get_stats() key
+_STAT_COLUMNS = (
+    ("Total Events", "total_events"),
+    ("Successes", "successes"),
+    ("Failures", "failures"),
+    ("Warnings", "warnings"),
+    ("Data Fetches", "data_fetches"),
+    ("Analyses", "analyses")
+)
+
 
 def ensure_dashboard() -> Dashboard:
     """Create or fetch a persistent Dashboard instance in session state."""
@@ -59,20 +116,12 @@ def render_status_monitor() -> None:
     st.subheader("📈 Activity Statistics")
     stats = monitor.get_stats()
     
-    col1, col2, col3, col4, col5, col6 = st.columns(6)
-    
-    with col1:
-        st.metric("Total Events", stats['total_events'])
-    with col2:
-        st.metric("Successes", stats['successes'], delta_color="normal")
-    with col3:
-        st.metric("Failures", stats['failures'], delta_color="inverse")
-    with col4:
-        st.metric("Warnings", stats['warnings'], delta_color="off")
-    with col5:
-        st.metric("Data Fetches", stats['data_fetches'])
-    with col6:
-        st.metric("Analyses", stats['analyses'])
+    # One single-row table instead of six metric widgets: one frontend delta per refresh
+    st.dataframe(
+        {label: [stats[key]] for label, key in _STAT_COLUMNS},
+        width='stretch',
+        hide_index=True
+    )
     
     st.markdown("---")
     
@@ -84,7 +133,7 @@ def render_status_monitor() -> None:
     with col_filter:
         filter_option = st.selectbox(
             "Filter by type",
-            ["All Events", "Success", "Error", "Warning", "Data Fetch", "Analysis", "Connection", "Info", "Cache"],
+            _FILTER_OPTIONS,
             index=0
         )
     
@@ -92,32 +141,18 @@ def render_status_monitor() -> None:
         event_count = st.number_input("Show last N events", min_value=10, max_value=500, value=100, step=10)
     
     # Get filtered events
-    filter_map = {
-        "All Events": None,
-        "Success": EventType.SUCCESS,
-        "Error": EventType.ERROR,
-        "Warning": EventType.WARNING,
-        "Data Fetch": EventType.DATA_FETCH,
-        "Analysis": EventType.ANALYSIS,
-        "Connection": EventType.CONNECTION,
-        "Info": EventType.INFO,
-        "Cache": EventType.CACHE
-    }
-    
-    event_type_filter = filter_map.get(filter_option)
-    events = monitor.get_filtered_events(event_type_filter, count=event_count)
+    event_type_filter = _FILTER_MAP.get(filter_option)
+    # One list per column: st.dataframe takes it as-is, no per-row dict inference
+    events = monitor.get_filtered_events_columnar(event_type_filter, count=event_count)
+    num_events = len(events["timestamp"])
     
     # Display events in a formatted table
-    if events:
-        st.markdown(f"**Showing {len(events)} most recent events** (newest first)")
-        
-        # Create DataFrame for better display
-        import pandas as pd
-        df_events = pd.DataFrame(events)
+    if num_events:
+        st.markdown(f"**Showing {num_events} most recent events** (newest first)")
         
         # Style the dataframe
         st.dataframe(
-            df_events,
+            events,
             column_config={
                 "timestamp": st.column_config.TextColumn("Time", width="small"),
                 "type": st.column_config.TextColumn("Type", width="small"),
@@ -129,14 +164,16 @@ def render_status_monitor() -> None:
             height=500
         )
         
-        # Detailed event view
-        with st.expander("📋 Detailed Event Log (Text Format)", expanded=False):
-            event_text = "\n".join([
-                f"[{e['timestamp']}] {e['type']} {e['message']}" + 
-                (f" - {e['details']}" if e['details'] else "")
-                for e in events
-            ])
-            st.text_area("", value=event_text, height=400, label_visibility="collapsed")
+        # Detailed event view; the text is only built while the expander is open
+        with _lazy_expander("📋 Detailed Event Log (Text Format)", key="status_event_text") as event_log:
+            if _is_open(event_log):
+                event_text = "\n".join([
+                    f"[{ts}] {kind} {message}" + (f" - {details}" if details else "")
+                    for ts, kind, message, details in zip(
+                        events["timestamp"], events["type"], events["message"], events["details"]
+                    )
+                ])
+                st.text_area("", value=event_text, height=400, label_visibility="collapsed")
     else:
         st.info("📝 No events logged yet. Events will appear here as the application runs.")
     
@@ -146,18 +183,22 @@ def render_status_monitor() -> None:
     if auto_refresh:
         st.caption(f"🕒 Last updated: {datetime.now().strftime('%H:%M:%S')} | Auto-refreshing every second...")
         
-        # Use a placeholder and auto-refresh with JavaScript
-        # This is a more efficient approach than using time.sleep + st.rerun
-        import time
-        time.sleep(1)
-        st.rerun()
+        # The browser-side timer triggers the rerun, so the script thread never blocks
+        if st_autorefresh is not None:
+            st_autorefresh(interval=1000, key="status_monitor_refresh")
+        else:
+            time.sleep(1)
+            st.rerun()
     else:
         st.caption(f"🕒 Last updated: {datetime.now().strftime('%H:%M:%S')} | Auto-refresh disabled. Click 'Refresh Now' to update manually.")
 
 
+# Commas, newlines, semicolons and tabs all separate symbols in the text area
+_SYM_SEP = re.compile(r"[,\n\r\t;]+")
+
+
 def parse_symbols(input_text: str) -> List[str]:
-    symbols = [s.strip() for s in input_text.replace("\n", ",").split(",") if s.strip()]
-    return symbols
+    return [s for s in (t.strip() for t in _SYM_SEP.split(input_text)) if s]
 
 
 def capture_output(fn, *args, **kwargs) -> Tuple[Optional[object], str, Optional[BaseException]]:
@@ -176,6 +217,8 @@ def capture_output(fn, *args, **kwargs) -> Tuple[Optional[object], str, Optional
 
 def get_mt5_status(dashboard: Dashboard) -> Dict:
     """Get MT5 connection status and details"""
+    # DataManager tracks the connection in memory (set by connect/disconnect), so this
+    # never talks to the terminal and is safe to call on the render thread
     try:
         is_connected = dashboard.data_manager.is_connected()
         use_mt5 = dashboard.data_manager.use_mt5
@@ -197,22 +240,53 @@ def get_mt5_status(dashboard: Dashboard) -> Dict:
         }
 
 
-def render_mt5_connection_card(dashboard: Dashboard) -> None:
+# MT5 badge per status tag: (icon, Streamlit alert level, label)
+_MT5_STATE = {
+    "error": ("🔴", "error", "Error"),
+    "disabled": ("⚠️", "warning", "Disabled"),
+    "connected": ("🟢", "success", "Connected"),
+    "down": ("🟡", "warning", "Disconnected"),
+}
+
+
+def _mt5_state(status: Dict) -> str:
+    """Map a get_mt5_status dict to its _MT5_STATE key."""
+    if status.get('error'):
+        return "error"
+    if not status['enabled']:
+        return "disabled"
+    return "connected" if status['connected'] else "down"
+
+
+def _render_mt5_badge(status: Dict) -> None:
+    """Show the MT5 status as a single alert box."""
+    icon, level, label = _MT5_STATE[_mt5_state(status)]
+    getattr(st, level)(f"{icon} **MT5 Status:** {label}")
+
+
+# Help text lives in help/<slug>.md and is read only when a section renders
+HELP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "help")
+
+
+@_cache_data(show_spinner=False)
+def load_help(slug: str) -> str:
+    """Return help/<slug> (".md" appended when there is no extension), read once per process."""
+    if not os.path.splitext(slug)[1]:
+        slug += ".md"
+    with open(os.path.join(HELP_DIR, slug), encoding="utf-8") as f:
+        return f.read()
+
+
+def render_mt5_connection_card(dashboard: Dashboard, mt5_status: Optional[Dict] = None) -> None:
     """Render MT5 connection status card with controls"""
-    mt5_status = get_mt5_status(dashboard)
+    if mt5_status is None:
+        mt5_status = get_mt5_status(dashboard)
     
     # Connection Status Header
     col1, col2, col3 = st.columns([2, 1, 1])
     
     with col1:
-        if mt5_status.get('error'):
-            st.error("🔴 **MT5 Status:** Error")
-        elif not mt5_status['enabled']:
-            st.warning("⚠️ **MT5 Status:** Disabled")
-        elif mt5_status['connected']:
-            st.success("🟢 **MT5 Status:** Connected")
-        else:
-            st.warning("🟡 **MT5 Status:** Disconnected")
+        _render_mt5_badge(mt5_status)
     
     with col2:
         if mt5_status['enabled'] and not mt5_status['connected']:
@@ -250,79 +324,70 @@ def render_mt5_connection_card(dashboard: Dashboard) -> None:
         # Troubleshooting section - only show if not connected
         if not mt5_status['connected']:
             with st.expander("🔧 Troubleshooting - Connection Issues", expanded=False):
-                st.markdown("""
-                **If connection gets stuck or fails:**
-                
-                1. **Check MT5 Terminal is Running**
-                   - Open MetaTrader 5 desktop application
-                   - Make sure you're logged in
-                   
-                2. **Verify Credentials**
-                   - Login: {login}
-                   - Server: {server}
-                   - Check these match your MT5 terminal
-                   
-                3. **Restart MT5 Terminal**
-                   - Close MetaTrader 5 completely
-                   - Wait 5 seconds
-                   - Reopen and login
-                   - Try connecting again
-                   
-                4. **Check Terminal Path**
-                   - Default: `C:\\Program Files\\MetaTrader 5\\terminal64.exe`
-                   - Set MT5_PATH environment variable if different
-                   
-                5. **Enable Algo Trading**
-                   - In MT5: Tools → Options → Expert Advisors
-                   - Check "Allow automated trading"
-                   - Check "Allow DLL imports"
-                """.format(login=mt5_status['login'], server=mt5_status['server']))
+                st.markdown(load_help("mt5_troubleshooting").format(login=mt5_status['login'], server=mt5_status['server']))
                 
                 st.info("💡 **Tip:** Most connection issues are fixed by restarting MT5 terminal")
 
 
-def render_system_metrics(dashboard: Dashboard) -> None:
+# Columns the metrics and tables actually read from the sentiment log
+LOG_COLUMNS = ("Date", "Symbol", "Final Bias", "Confidence", "Verified", "Weighted Score")
+
+
+@_cache_data(show_spinner=False)
+def _load_log(path: str, mtime: float, size: int, columns: Optional[Tuple[str, ...]] = None) -> pd.DataFrame:
+    """Parse the sentiment log (Parquet mirror when fresh); cached until the file's mtime or size changes."""
+    df = read_log(path, columns)
+    # The mirror already stores these as categoricals; the workbook fallback needs the cast
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    return df
+
+
+def load_sentiment_log(path: str, columns: Optional[Tuple[str, ...]] = LOG_COLUMNS) -> pd.DataFrame:
+    """Load the given sentiment log columns through the mtime-keyed cache."""
+    info = os.stat(path)
+    return _load_log(path, info.st_mtime, info.st_size, columns)
+
+
+@_cache_data(show_spinner=False)
+def _load_log_tail(path: str, mtime: float, size: int, n: int) -> pd.DataFrame:
+    """Last n log rows without parsing the whole sheet; cached per log version."""
+    return read_log_tail(path, n, LOG_COLUMNS)
+
+
+def render_system_metrics(dashboard: Dashboard, mt5_status: Optional[Dict] = None) -> None:
     """Render system metrics in a card layout"""
     st.subheader("📊 System Metrics")
     
     # Get metrics
     excel_file = getattr(dashboard, "excel_file", "sentiment_log.xlsx")
     
+    # Load the log once; both headline metrics come from the same frame
+    df = None
+    if os.path.exists(excel_file):
+        try:
+            df = load_sentiment_log(excel_file)
+        except Exception:
+            df = None
+    
+    total_predictions = 0 if df is None else len(df)
+    accuracy = 0
+    if df is not None and "Verified" in df.columns:
+        # One tabulation pass instead of isin + mask + compare
+        vc = df["Verified"].value_counts()
+        correct = int(vc.get("✅ True", 0))
+        verified = correct + int(vc.get("❌ False", 0))
+        accuracy = (correct / verified) * 100 if verified else 0
+    
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         # Total predictions
-        if os.path.exists(excel_file):
-            try:
-                df = pd.read_excel(excel_file)
-                total_predictions = len(df)
-            except:
-                total_predictions = 0
-        else:
-            total_predictions = 0
-        
         st.metric("Total Predictions", total_predictions)
     
     with col2:
         # Accuracy
-        if os.path.exists(excel_file):
-            try:
-                df = pd.read_excel(excel_file)
-                if "Verified" in df.columns:
-                    verified_mask = df["Verified"].isin(["✅ True", "❌ False"])
-                    verified_df = df[verified_mask]
-                    if not verified_df.empty:
-                        correct = (verified_df["Verified"] == "✅ True").sum()
-                        accuracy = (correct / len(verified_df)) * 100
-                    else:
-                        accuracy = 0
-                else:
-                    accuracy = 0
-            except:
-                accuracy = 0
-        else:
-            accuracy = 0
-        
         st.metric("Accuracy", f"{accuracy:.1f}%")
     
     with col3:
@@ -332,7 +397,8 @@ def render_system_metrics(dashboard: Dashboard) -> None:
     
     with col4:
         # MT5 Status
-        mt5_status = get_mt5_status(dashboard)
+        if mt5_status is None:
+            mt5_status = get_mt5_status(dashboard)
         status_text = "🟢 Online" if mt5_status['connected'] else "🔴 Offline"
         st.metric("MT5 Connection", status_text)
 
@@ -346,7 +412,8 @@ def render_latest_log_table(excel_file: str) -> None:
         return
     
     try:
-        df = pd.read_excel(excel_file)
+        info = os.stat(excel_file)
+        df = _load_log_tail(excel_file, info.st_mtime, info.st_size, 20)
         if df.empty:
             st.info("📝 Sentiment log is empty.")
             return
@@ -359,7 +426,7 @@ def render_latest_log_table(excel_file: str) -> None:
         
         # Display with better formatting
         st.dataframe(
-            df.tail(20)[display_cols],
+            df[display_cols].tail(20),
             width='stretch',
             hide_index=True,
             height=400
@@ -369,6 +436,33 @@ def render_latest_log_table(excel_file: str) -> None:
         st.error(f"❌ Could not read {excel_file}: {e}")
 
 
+# Text previews are capped so a huge report cannot bloat the page or the cache
+REPORT_PREVIEW_LIMIT = 200_000
+
+
+@_cache_data(show_spinner=False, max_entries=16)
+def _read_report_preview(path: str, mtime: float, size: int) -> str:
+    """Read at most REPORT_PREVIEW_LIMIT characters of a text report."""
+    with open(path, "r", encoding="utf-8", errors="replace") as fh:
+        text = fh.read(REPORT_PREVIEW_LIMIT + 1)
+    if len(text) > REPORT_PREVIEW_LIMIT:
+        text = text[:REPORT_PREVIEW_LIMIT] + "\n… [truncated, download for the full report]"
+    return text
+
+
+def _read_report_bytes(path: str) -> bytes:
+    """Read a report for download; handed to st.download_button so it only runs on click."""
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
+@_cache_data(show_spinner=False)
+def _list_reports(report_dir: str, mtime_ns: int) -> List[str]:
+    """Report file names in reverse name order; keyed on the directory mtime."""
+    with os.scandir(report_dir) as entries:
+        return sorted((entry.name for entry in entries if entry.is_file()), reverse=True)
+
+
 def render_reports_section(report_dir: str) -> None:
     """Render reports section with improved UI"""
     st.subheader("📄 Analysis Reports")
@@ -377,10 +471,7 @@ def render_reports_section(report_dir: str) -> None:
         st.info("📁 No reports directory yet. Reports will appear here after running analysis.")
         return
     
-    files = sorted(
-        [f for f in os.listdir(report_dir) if os.path.isfile(os.path.join(report_dir, f))],
-        reverse=True,
-    )
+    files = _list_reports(report_dir, os.stat(report_dir).st_mtime_ns)
     
     if not files:
         st.info("📁 No reports generated yet. Run an analysis to generate reports.")
@@ -396,12 +487,10 @@ def render_reports_section(report_dir: str) -> None:
         if selection:
             path = os.path.join(report_dir, selection)
             try:
-                with open(path, "rb") as fh:
-                    data = fh.read()
                 mime = "application/pdf" if selection.lower().endswith(".pdf") else "text/plain"
                 st.download_button(
                     label="⬇️ Download",
-                    data=data,
+                    data=functools.partial(_read_report_bytes, path),
                     file_name=selection,
                     mime=mime,
                     width='stretch',
@@ -413,9 +502,8 @@ def render_reports_section(report_dir: str) -> None:
     if selection and selection.lower().endswith(".txt"):
         try:
             path = os.path.join(report_dir, selection)
-            with open(path, "rb") as fh:
-                data = fh.read()
-            text = data.decode("utf-8", errors="replace")
+            info = os.stat(path)
+            text = _read_report_preview(path, info.st_mtime, info.st_size)
             
             with st.expander("👁️ Preview Report", expanded=True):
                 st.text_area("", value=text, height=400, label_visibility="collapsed")
@@ -462,39 +550,15 @@ def main() -> None:
     )
     
     # Custom CSS for better styling
-    st.markdown("""
-    <style>
-        .main-header {
-            font-size: 2.5rem;
-            font-weight: bold;
-            color: #1f77b4;
-            margin-bottom: 1rem;
-        }
-        .section-header {
-            background: linear-gradient(90deg, #1f77b4 0%, #ff7f0e 100%);
-            padding: 0.5rem;
-            border-radius: 5px;
-            color: white;
-            margin-bottom: 1rem;
-        }
-        .stButton>button {
-            border-radius: 5px;
-            font-weight: 500;
-        }
-        .metric-card {
-            background-color: #f0f2f6;
-            padding: 1rem;
-            border-radius: 5px;
-            border-left: 4px solid #1f77b4;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(f"<style>{load_help('dashboard.css')}</style>", unsafe_allow_html=True)
     
     # Main header
     st.markdown('<div class="main-header">🤖 Trading Bot Dashboard</div>', unsafe_allow_html=True)
     st.markdown("*Automated trading sentiment analysis with MT5 integration*")
     
     dashboard = ensure_dashboard()
+    # One MT5 probe per rerun, shared by the connection card and the metrics row
+    mt5_status = get_mt5_status(dashboard)
     
     # ============================================================
     # SIDEBAR - Configuration & Settings
@@ -575,13 +639,13 @@ def main() -> None:
     
     # MT5 Connection Status (always visible at top)
     with st.container():
-        render_mt5_connection_card(dashboard)
+        render_mt5_connection_card(dashboard, mt5_status)
     
     st.markdown("---")
     
     # System Metrics Dashboard
     with st.container():
-        render_system_metrics(dashboard)
+        render_system_metrics(dashboard, mt5_status)
     
     st.markdown("---")
     
@@ -4,8 +4,14 @@ This helps identify the correct symbol names for your broker.
 Now uses production-grade MT5 connector when available.
 """
 
+import contextlib
+import functools
+import io
+import itertools
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Try to import production-grade MT5 connector
 try:
@@ -16,15 +22,38 @@ except ImportError:
     MT5Config = None
     MT5_CONNECTOR_AVAILABLE = False
 
-# Fallback to direct MT5 module
+# A running mt5_daemon.py keeps the terminal initialized between runs
 try:
-    import MetaTrader5 as mt5
-    MT5_AVAILABLE = True
+    from mt5_daemon import DaemonClient
 except ImportError:
-    mt5 = None
-    MT5_AVAILABLE = False
+    DaemonClient = None
 
-if not MT5_CONNECTOR_AVAILABLE and not MT5_AVAILABLE:
+# Fallback to direct MT5 module, imported by _get_mt5() only when a legacy path runs
+# (None = not tried yet)
+mt5 = None
+MT5_AVAILABLE = None
+
+# Optional multi-pattern matcher: one pass over the names answers every common search
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _get_mt5():
+    """Import MetaTrader5 on first use; returns the module or None if not installed"""
+    global mt5, MT5_AVAILABLE
+    if MT5_AVAILABLE is None:
+        try:
+            import MetaTrader5 as _mt5
+            mt5 = _mt5
+            MT5_AVAILABLE = True
+        except ImportError:
+            MT5_AVAILABLE = False
+    return mt5
+
+
+if not MT5_CONNECTOR_AVAILABLE and _get_mt5() is None:
     print("❌ Neither MT5 connector nor MetaTrader5 package is available.")
     print("   Install with: pip install MetaTrader5")
     sys.exit(1)
@@ -35,6 +64,43 @@ MT5_PASSWORD = os.getenv("MT5_PASSWORD", "dFbKaNLWQ53@9@Z")
 MT5_SERVER = os.getenv("MT5_SERVER", "ExnessKE-MT5Trial9")
 MT5_PATH = os.getenv("MT5_PATH", r"C:\\Program Files\\MetaTrader 5\\terminal64.exe")
 
+# Section dividers, built once
+BANNER80 = "=" * 80
+BANNER60 = "=" * 60
+DASH60 = "-" * 60
+
+# symbols_get() round-trips to the terminal and builds thousands of structs,
+# so one snapshot per source serves every listing and search in a run
+SYMBOLS_CACHE_TTL = 300  # seconds
+_SYMBOLS_CACHE = {}
+# Characters with a meaning inside a symbols_get() group mask
+_GROUP_MASK_CHARS = frozenset("*,!")
+# Upper-cased search term -> (symbols snapshot, matches) filled by _prime_search_buckets
+_SEARCH_BUCKETS = {}
+
+# Concurrent symbol_info round trips for --search
+SYMBOL_INFO_WORKERS = 8
+
+# (label, SymbolInfo attribute) rows printed per symbol
+SYMBOL_DETAIL_FIELDS = (
+    ("Description", "description"),
+    ("Path", "path"),
+    ("Currency Base", "currency_base"),
+    ("Currency Profit", "currency_profit"),
+    ("Currency Margin", "currency_margin"),
+    ("Digits", "digits"),
+    ("Trade Mode", "trade_mode"),
+    ("Point", "point"),
+    ("Spread", "spread"),
+    ("Visible", "visible"),
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _terminal_path_valid(path):
+    """True if path names an existing terminal; checked once per path per process"""
+    return bool(path) and os.path.exists(path)
+
 
 def connect_mt5_with_connector():
     """Connect to MT5 using production-grade connector"""
@@ -62,7 +128,14 @@ def connect_mt5_with_connector():
         return False, None
 
 def connect_mt5():
-    """Connect to MT5 (tries connector first, then fallback to legacy)"""
+    """Connect to MT5 (tries the daemon, then the connector, then falls back to legacy)"""
+    # A running daemon already holds an initialized terminal: skip MT5 init entirely
+    if DaemonClient is not None:
+        client = DaemonClient.connect()
+        if client is not None:
+            print(f"✅ Connected to MT5 (via mt5_daemon)")
+            return True, client
+    
     # Try production connector first
     if MT5_CONNECTOR_AVAILABLE:
         success, connector = connect_mt5_with_connector()
@@ -71,13 +144,13 @@ def connect_mt5():
         print("   Falling back to legacy connection method...")
     
     # Legacy connection method
-    if not MT5_AVAILABLE:
+    if _get_mt5() is None:
         print("❌ MT5 module not available")
         return False, None
     
     try:
         # Initialize MT5
-        if MT5_PATH and os.path.exists(MT5_PATH):
+        if _terminal_path_valid(MT5_PATH):
             if not mt5.initialize(MT5_PATH):
                 print(f"❌ MT5 initialize failed: {mt5.last_error()}")
                 return False, None
@@ -101,123 +174,243 @@ def connect_mt5():
         return False, None
 
 
+class _ConnectorSymbolInfo:
+    """Name-only stand-in for MT5 SymbolInfo on the connector path"""
+    __slots__ = ("name", "description")
+    
+    def __init__(self, name):
+        self.name = self.description = name
+
+
+def _get_symbols_cached(connector=None, refresh=False):
+    """
+    Return every symbol, fetched once per SYMBOLS_CACHE_TTL.
+
+    Via the connector this is a tuple of names; via the MetaTrader5 module it is
+    the tuple of SymbolInfo structs. Empty results are not cached.
+    """
+    return _symbols_entry(connector, refresh)[0]
+
+
+def _symbols_entry(connector=None, refresh=False):
+    """(symbols, upper-cased names) for the source, refetched after SYMBOLS_CACHE_TTL."""
+    if not refresh:
+        cached = _fresh_snapshot(connector)
+        if cached is not None:
+            return cached
+    
+    # Upper-cased names stay str: ASCII str containment is already a C search with no
+    # per-test allocation, and measured faster than bytes here
+    now = time.monotonic()
+    if connector is not None:
+        symbols = tuple(connector.get_available_symbols())
+        upper_names = tuple(name.upper() for name in symbols)
+    elif _get_mt5() is not None:
+        symbols = tuple(mt5.symbols_get() or ())
+        upper_names = tuple(s.name.upper() for s in symbols)
+    else:
+        symbols = upper_names = ()
+    
+    if symbols:
+        _SYMBOLS_CACHE["connector" if connector is not None else "mt5"] = (now, symbols, upper_names)
+    return symbols, upper_names
+
+
+def _fresh_snapshot(connector=None):
+    """Cached (symbols, upper-cased names) for the source, or None if absent or expired."""
+    cached = _SYMBOLS_CACHE.get("connector" if connector is not None else "mt5")
+    if cached is not None and time.monotonic() - cached[0] < SYMBOLS_CACHE_TTL:
+        return cached[1:]
+    return None
+
+
+def _search_candidates(search_term, connector=None):
+    """
+    (symbols, upper-cased names) worth scanning for search_term.
+
+    Reuses the full snapshot when one is cached. Otherwise the terminal narrows the
+    list with a symbols_get group mask; an empty or failed masked fetch falls back
+    to the full list.
+    """
+    cached = _fresh_snapshot(connector)
+    if cached is not None:
+        return cached
+    
+    if search_term and not _GROUP_MASK_CHARS.intersection(search_term):
+        mask = f"*{search_term}*"
+        if connector is not None:
+            symbols = tuple(connector.get_available_symbols(group=mask))
+            upper_names = tuple(name.upper() for name in symbols)
+        else:
+            symbols = tuple(mt5.symbols_get(group=mask) or ())
+            upper_names = tuple(s.name.upper() for s in symbols)
+        if symbols:
+            return symbols, upper_names
+    
+    return _symbols_entry(connector)
+
+
+def _prime_search_buckets(search_terms, connector=None):
+    """Match all search terms in one Aho-Corasick pass; no-op without pyahocorasick."""
+    _SEARCH_BUCKETS.clear()
+    if ahocorasick is None:
+        return
+    symbols, upper_names = _symbols_entry(connector)
+    if not symbols:
+        return
+    
+    automaton = ahocorasick.Automaton()
+    for term in search_terms:
+        automaton.add_word(term.upper(), term.upper())
+    automaton.make_automaton()
+    
+    buckets = {term.upper(): [] for term in search_terms}
+    for sym, upper in zip(symbols, upper_names):
+        # A term can occur twice in one name; bucket each symbol once
+        for term in {found for _, found in automaton.iter(upper)}:
+            buckets[term].append(sym)
+    for term, matches in buckets.items():
+        _SEARCH_BUCKETS[term] = (symbols, matches)
+
+
+def _scan_matches(search_upper, symbols, upper_names):
+    """
+    Snapshot entries whose upper-cased name contains search_upper.
+
+    Returns the primed bucket list when there is one, otherwise a lazy generator.
+    """
+    primed = _SEARCH_BUCKETS.get(search_upper)
+    if primed is not None and primed[0] is symbols:
+        return primed[1]
+    return (s for s, upper in zip(symbols, upper_names) if search_upper in upper)
+
+
+@contextlib.contextmanager
+def _buffered_stdout():
+    """Collect everything printed in the block and write it to stdout in one call"""
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
 def list_all_symbols(connector=None):
     """List all available symbols"""
     # Use connector if available
     if connector is not None:
-        symbol_names = connector.get_available_symbols()
+        symbol_names = _get_symbols_cached(connector)
         if not symbol_names:
             print("❌ No symbols found")
             return []
         
-        print(f"\n{'='*80}")
+        print("\n" + BANNER80)
         print(f"Found {len(symbol_names)} symbols (via connector)")
-        print(f"{'='*80}\n")
+        print(BANNER80 + "\n")
         
         # Convert to symbol objects for compatibility
-        class SymbolInfo:
-            def __init__(self, name):
-                self.name = name
-                self.description = name
-        
-        return [SymbolInfo(name) for name in symbol_names]
+        return [_ConnectorSymbolInfo(name) for name in symbol_names]
     
     # Legacy method
-    if not MT5_AVAILABLE:
+    if _get_mt5() is None:
         print("❌ MT5 module not available")
         return []
     
-    symbols = mt5.symbols_get()
+    symbols = _get_symbols_cached()
     
-    if symbols is None or len(symbols) == 0:
+    if not symbols:
         print("❌ No symbols found")
         return []
     
-    print(f"\n{'='*80}")
+    print("\n" + BANNER80)
     print(f"Found {len(symbols)} symbols")
-    print(f"{'='*80}\n")
+    print(BANNER80 + "\n")
     
     return symbols
 
 
-def find_matching_symbols(search_term, connector=None):
-    """Find symbols matching a search term"""
+def find_matching_symbols(search_term, connector=None, limit=None):
+    """Find symbols matching a search term (at most limit of them when given)"""
     # Use connector if available
     if connector is not None:
-        all_symbol_names = connector.get_available_symbols()
+        # Names and their upper-cased forms come from the same snapshot
+        all_symbol_names, upper_names = _search_candidates(search_term, connector)
         if not all_symbol_names:
             return []
         
-        search_upper = search_term.upper()
-        matching_names = [s for s in all_symbol_names if search_upper in s.upper()]
+        matching_names = _scan_matches(search_term.upper(), all_symbol_names, upper_names)
+        if limit is not None:
+            matching_names = itertools.islice(matching_names, limit)
         
         # Convert to symbol objects for compatibility
-        class SymbolInfo:
-            def __init__(self, name):
-                self.name = name
-                self.description = name
-        
-        return [SymbolInfo(name) for name in matching_names]
+        return [_ConnectorSymbolInfo(name) for name in matching_names]
     
     # Legacy method
-    if not MT5_AVAILABLE:
+    if _get_mt5() is None:
         return []
     
-    symbols = mt5.symbols_get()
+    symbols, upper_names = _search_candidates(search_term)
     
-    if symbols is None:
+    if not symbols:
         return []
     
-    search_upper = search_term.upper()
-    matching = [s for s in symbols if search_upper in s.name.upper()]
+    return list(itertools.islice(_scan_matches(search_term.upper(), symbols, upper_names), limit))
+
+
+def count_matching_symbols(search_term, connector=None):
+    """Count symbols matching a search term without building the match list"""
+    if connector is None and _get_mt5() is None:
+        return 0
     
-    return matching
+    symbols, upper_names = _search_candidates(search_term, connector)
+    matches = _scan_matches(search_term.upper(), symbols, upper_names)
+    if isinstance(matches, list):
+        return len(matches)
+    return sum(1 for _ in matches)
+
+
+def _fetch_symbol_info(symbol_name, connector=None):
+    """Fetch a symbol's details via the connector or MetaTrader5 (None if not found)"""
+    if connector is not None:
+        return connector.get_symbol_info(symbol_name)
+    return mt5.symbol_info(symbol_name)
 
 
 def display_symbol_info(symbol_name, connector=None):
     """Display detailed information about a symbol"""
-    # Use connector if available
-    if connector is not None:
-        symbol = connector.get_symbol_info(symbol_name)
-    elif MT5_AVAILABLE:
-        symbol = mt5.symbol_info(symbol_name)
-    else:
+    if connector is None and _get_mt5() is None:
         print(f"❌ Cannot get symbol info - no connection method available")
         return
     
+    _print_symbol_info(symbol_name, _fetch_symbol_info(symbol_name, connector))
+
+
+def _print_symbol_info(symbol_name, symbol):
+    """Print the details of an already fetched symbol"""
     if symbol is None:
         print(f"❌ Symbol '{symbol_name}' not found")
         return
     
-    print(f"\n{'='*60}")
-    print(f"Symbol: {symbol.name}")
-    print(f"{'='*60}")
+    # Some attributes may not be available with all connection methods: show the rest
+    details = "".join(
+        f"{label}: {getattr(symbol, attr, 'N/A')}\n" for label, attr in SYMBOL_DETAIL_FIELDS
+    )
+    missing = [attr for _, attr in SYMBOL_DETAIL_FIELDS if not hasattr(symbol, attr)]
+    if missing:
+        details += f"⚠️ Some details not available: {', '.join(missing)}\n"
     
-    # Some attributes may not be available with all connection methods
-    try:
-        print(f"Description: {symbol.description}")
-        print(f"Path: {symbol.path}")
-        print(f"Currency Base: {symbol.currency_base}")
-        print(f"Currency Profit: {symbol.currency_profit}")
-        print(f"Currency Margin: {symbol.currency_margin}")
-        print(f"Digits: {symbol.digits}")
-        print(f"Trade Mode: {symbol.trade_mode}")
-        print(f"Point: {symbol.point}")
-        print(f"Spread: {symbol.spread}")
-        print(f"Visible: {symbol.visible}")
-    except AttributeError as e:
-        print(f"⚠️ Some details not available: {e}")
-    
-    print(f"{'='*60}\n")
+    sys.stdout.write(f"\n{BANNER60}\nSymbol: {symbol.name}\n{BANNER60}\n{details}{BANNER60}\n\n")
 
 
 def main():
     """Main function"""
-    print("\n" + "="*80)
+    print("\n" + BANNER80)
     print("MT5 Symbol Lister - Find Available Symbols for Your Broker")
     if MT5_CONNECTOR_AVAILABLE:
         print("(Using Production-Grade MT5 Connector)")
-    print("="*80 + "\n")
+    print(BANNER80 + "\n")
     
     # Connect to MT5
     success, connector = connect_mt5()
@@ -226,98 +419,118 @@ def main():
         sys.exit(1)
     
     try:
-        # Search for common forex pairs
-        common_searches = ["GBP", "USD", "EUR", "XAU", "GOLD", "BTCUSD"]
-        
-        print("\n" + "="*80)
-        print("SEARCHING FOR COMMON TRADING SYMBOLS")
-        print("="*80 + "\n")
-        
-        found_symbols = {}
-        
-        for search_term in common_searches:
-            matches = find_matching_symbols(search_term, connector)
-            if matches:
-                print(f"\n🔍 Symbols containing '{search_term}' ({len(matches)} found):")
-                print("-" * 60)
-                for sym in matches[:10]:  # Show first 10 matches
-                    desc = getattr(sym, 'description', sym.name)
-                    print(f"   • {sym.name:20s} - {desc}")
-                    found_symbols[sym.name] = sym
-                
-                if len(matches) > 10:
-                    print(f"   ... and {len(matches) - 10} more")
-        
-        # Create suggested mapping
-        print("\n" + "="*80)
-        print("SUGGESTED SYMBOL MAPPING FOR YOUR CONFIGURATION")
-        print("="*80 + "\n")
-        
-        # Common pairs to look for
-        desired_pairs = {
-            "GBPUSD": ["GBPUSD", "GBPUSDm", "GBPUSD.a", "GBPUSD."],
-            "XAUUSD": ["XAUUSD", "XAUUSDm", "GOLD", "GOLDm", "XAUUSD."],
-            "EURUSD": ["EURUSD", "EURUSDm", "EURUSD.a", "EURUSD."],
-            "USDJPY": ["USDJPY", "USDJPYm", "USDJPY.a"],
-            "BTCUSD": ["BTCUSD", "BTCUSDm", "BTCUSD."],
-        }
-        
-        mapping = {}
-        # Get all symbol names
-        if connector is not None:
-            symbol_names = connector.get_available_symbols()
-        elif MT5_AVAILABLE:
-            all_symbols = mt5.symbols_get()
-            symbol_names = [s.name for s in all_symbols] if all_symbols else []
-        else:
-            symbol_names = []
-        
-        for standard_name, variations in desired_pairs.items():
-            for variant in variations:
-                if variant in symbol_names:
-                    mapping[standard_name] = variant
-                    print(f"✅ {standard_name:10s} -> {variant}")
-                    break
+        # Sections are printed with one write each instead of one per print()
+        with _buffered_stdout():
+            # Search for common forex pairs
+            common_searches = ["GBP", "USD", "EUR", "XAU", "GOLD", "BTCUSD"]
+            
+            print("\n" + BANNER80)
+            print("SEARCHING FOR COMMON TRADING SYMBOLS")
+            print(BANNER80 + "\n")
+            
+            found_symbols = {}
+            _prime_search_buckets(common_searches, connector)
+            
+            for search_term in common_searches:
+                # Only the first 10 are shown; the 11th tells us whether a full count is needed
+                matches = find_matching_symbols(search_term, connector, limit=11)
+                if matches:
+                    if len(matches) > 10:
+                        total = count_matching_symbols(search_term, connector)
+                    else:
+                        total = len(matches)
+                    print(f"\n🔍 Symbols containing '{search_term}' ({total} found):")
+                    print(DASH60)
+                    for i, sym in enumerate(matches):
+                        if i >= 10:  # Show first 10 matches
+                            break
+                        desc = getattr(sym, 'description', sym.name)
+                        print(f"   • {sym.name:20s} - {desc}")
+                        found_symbols[sym.name] = sym
+                    
+                    if total > 10:
+                        print(f"   ... and {total - 10} more")
+            
+            # Create suggested mapping
+            print("\n" + BANNER80)
+            print("SUGGESTED SYMBOL MAPPING FOR YOUR CONFIGURATION")
+            print(BANNER80 + "\n")
+            
+            # Common pairs to look for
+            desired_pairs = {
+                "GBPUSD": ["GBPUSD", "GBPUSDm", "GBPUSD.a", "GBPUSD."],
+                "XAUUSD": ["XAUUSD", "XAUUSDm", "GOLD", "GOLDm", "XAUUSD."],
+                "EURUSD": ["EURUSD", "EURUSDm", "EURUSD.a", "EURUSD."],
+                "USDJPY": ["USDJPY", "USDJPYm", "USDJPY.a"],
+                "BTCUSD": ["BTCUSD", "BTCUSDm", "BTCUSD."],
+            }
+            
+            mapping = {}
+            # Get all symbol names as a set: the variant checks below are membership tests
+            if connector is not None:
+                symbol_names = connector.get_available_symbols(as_set=True)
+            elif _get_mt5() is not None:
+                symbol_names = {s.name for s in _get_symbols_cached()}
             else:
-                print(f"❌ {standard_name:10s} -> NOT FOUND (searched: {', '.join(variations)})")
-        
-        # Generate configuration code
-        if mapping:
-            print("\n" + "="*80)
-            print("PYTHON CODE TO ADD TO YOUR CONFIGURATION")
-            print("="*80 + "\n")
-            print("# Add this to data_manager.py or create a config file:")
-            print("\nBROKER_SYMBOL_MAPPING = {")
-            for standard, broker_specific in mapping.items():
-                print(f'    "{standard}": "{broker_specific}",')
-            print("}\n")
-        
-        # Show how to list all symbols
-        print("\n" + "="*80)
-        print("NEED TO SEE ALL SYMBOLS?")
-        print("="*80)
-        print("\nTo see all available symbols, run:")
-        print("  python list_mt5_symbols.py --all")
-        print("\nTo search for specific symbols, run:")
-        print("  python list_mt5_symbols.py --search GBPUSD")
+                symbol_names = set()
+            
+            for standard_name, variations in desired_pairs.items():
+                # First variation the broker lists, one hash probe per candidate
+                hit = next((v for v in variations if v in symbol_names), None)
+                if hit is not None:
+                    mapping[standard_name] = hit
+                    print(f"✅ {standard_name:10s} -> {hit}")
+                else:
+                    print(f"❌ {standard_name:10s} -> NOT FOUND (searched: {', '.join(variations)})")
+            
+            # Generate configuration code
+            if mapping:
+                # Build the whole block and emit it with one write
+                header = (
+                    f"\n{BANNER80}\n"
+                    "PYTHON CODE TO ADD TO YOUR CONFIGURATION\n"
+                    f"{BANNER80}\n\n"
+                    "# Add this to data_manager.py or create a config file:\n"
+                )
+                body = "\nBROKER_SYMBOL_MAPPING = {\n" + "".join(
+                    f'    "{standard}": "{broker_specific}",\n'
+                    for standard, broker_specific in mapping.items()
+                ) + "}\n\n"
+                sys.stdout.write(header + body)
+            
+            # Show how to list all symbols
+            print("\n" + BANNER80)
+            print("NEED TO SEE ALL SYMBOLS?")
+            print(BANNER80)
+            print("\nTo see all available symbols, run:")
+            print("  python list_mt5_symbols.py --all")
+            print("\nTo search for specific symbols, run:")
+            print("  python list_mt5_symbols.py --search GBPUSD")
         
         # Check command line arguments
         if len(sys.argv) > 1:
             if sys.argv[1] == "--all":
-                print("\n" + "="*80)
-                print("ALL AVAILABLE SYMBOLS")
-                print("="*80 + "\n")
-                symbols = list_all_symbols(connector)
-                for sym in symbols:
-                    desc = getattr(sym, 'description', sym.name)
-                    print(f"{sym.name:30s} {desc}")
+                with _buffered_stdout():
+                    print("\n" + BANNER80)
+                    print("ALL AVAILABLE SYMBOLS")
+                    print(BANNER80 + "\n")
+                    symbols = list_all_symbols(connector)
+                    for sym in symbols:
+                        desc = getattr(sym, 'description', sym.name)
+                        print(f"{sym.name:30s} {desc}")
             
             elif sys.argv[1] == "--search" and len(sys.argv) > 2:
                 search_term = sys.argv[2]
                 matches = find_matching_symbols(search_term, connector)
                 print(f"\n🔍 Symbols matching '{search_term}':")
-                for sym in matches:
-                    display_symbol_info(sym.name, connector)
+                # Each lookup is a blocking terminal round trip: overlap them, print in order
+                names = [sym.name for sym in matches]
+                fetch = functools.partial(_fetch_symbol_info, connector=connector)
+                with ThreadPoolExecutor(max_workers=SYMBOL_INFO_WORKERS) as pool:
+                    infos = list(pool.map(fetch, names))
+                with _buffered_stdout():
+                    for name, info in zip(names, infos):
+                        _print_symbol_info(name, info)
         
     finally:
         # Disconnect
@@ -0,0 +1,223 @@
+"""
+log_store.py - Sentiment Log Storage Helpers
+============================================
+
+The Excel workbook (sentiment_log.xlsx) remains the canonical log that the
+verifier and retrainer edit. Every writer also drops a Parquet mirror next to
+it so read-heavy consumers (the Streamlit GUI) can load only the columns they
+need without parsing the workbook XML, plus a small counts JSON for the
+headline totals.
+
+Author: Trading Bot Team
+Version: 1.0.0
+"""
+
+import json
+import os
+from collections import deque
+from typing import Dict, Optional, Sequence
+
+import pandas as pd
+
+# Parquet support is optional - readers fall back to the workbook without it
+try:
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    pq = None
+    PARQUET_AVAILABLE = False
+
+# openpyxl's streaming reader lets count_rows skip building a DataFrame
+try:
+    from openpyxl import load_workbook
+except ImportError:
+    load_workbook = None
+
+# Rust-based calamine reader (pandas >= 2.2) parses xlsx about twice as fast as openpyxl
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE: Optional[str] = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
+
+
+# Low-cardinality label columns stored dictionary-encoded so readers get pandas categoricals
+CATEGORY_COLUMNS = ("Verified", "Symbol", "Final Bias")
+
+
+def parquet_path(excel_file: str) -> str:
+    """Return the Parquet mirror path for a workbook (sentiment_log.parquet)."""
+    return os.path.splitext(excel_file)[0] + ".parquet"
+
+
+def counts_path(excel_file: str) -> str:
+    """Return the counters sidecar path for a workbook (sentiment_log.counts.json)."""
+    return os.path.splitext(excel_file)[0] + ".counts.json"
+
+
+def write_log_counts(df: pd.DataFrame, excel_file: str) -> None:
+    """Persist {total, verified, correct} next to the workbook. Never raises."""
+    if "Verified" in df.columns:
+        correct = int(df["Verified"].eq("✅ True").sum())
+        verified = correct + int(df["Verified"].eq("❌ False").sum())
+    else:
+        correct = verified = 0
+    try:
+        with open(counts_path(excel_file), "w", encoding="utf-8") as f:
+            json.dump({"total": len(df), "verified": verified, "correct": correct}, f)
+    except Exception as e:
+        print(f"⚠️ Could not write counts sidecar for {excel_file}: {e}")
+
+
+def read_log_counts(excel_file: str) -> Optional[Dict[str, int]]:
+    """Return the sidecar counters, or None if missing, unreadable or older than the workbook."""
+    path = counts_path(excel_file)
+    try:
+        if os.stat(excel_file).st_mtime > os.stat(path).st_mtime:
+            return None
+        with open(path, encoding="utf-8") as f:
+            counts = json.load(f)
+        return {k: int(counts[k]) for k in ("total", "verified", "correct")}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def write_log_mirror(df: pd.DataFrame, excel_file: str) -> None:
+    """Write the counters sidecar and Parquet mirror of a freshly saved workbook. Never raises."""
+    write_log_counts(df, excel_file)
+    if not PARQUET_AVAILABLE:
+        return
+    try:
+        df = df.astype({c: "category" for c in CATEGORY_COLUMNS if c in df.columns})
+        df.to_parquet(parquet_path(excel_file), engine="pyarrow", compression="zstd", index=False)
+    except Exception as e:
+        print(f"⚠️ Could not write Parquet mirror for {excel_file}: {e}")
+
+
+def read_workbook(excel_file: str, **kwargs) -> pd.DataFrame:
+    """pd.read_excel with the calamine engine when available, openpyxl otherwise."""
+    if EXCEL_ENGINE is not None:
+        try:
+            return pd.read_excel(excel_file, engine=EXCEL_ENGINE, **kwargs)
+        except (ImportError, ValueError) as e:
+            print(f"⚠️ calamine could not read {excel_file}, using openpyxl: {e}")
+    return pd.read_excel(excel_file, **kwargs)
+
+
+def fresh_parquet(excel_file: str) -> Optional[str]:
+    """Return the mirror path if it exists and is not older than the workbook."""
+    if not PARQUET_AVAILABLE:
+        return None
+    path = parquet_path(excel_file)
+    try:
+        mirror_mtime = os.stat(path).st_mtime
+    except OSError:
+        return None
+    try:
+        if os.stat(excel_file).st_mtime > mirror_mtime:
+            return None
+    except OSError:
+        pass
+    return path
+
+
+def read_log(excel_file: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """
+    Load the sentiment log, preferring the Parquet mirror.
+
+    Args:
+        excel_file: Path to the canonical workbook
+        columns: Optional subset of columns to load; unknown names are ignored
+
+    Returns:
+        DataFrame with the requested columns (all columns when None)
+    """
+    path = fresh_parquet(excel_file)
+    if path is not None:
+        try:
+            if columns is None:
+                return pd.read_parquet(path)
+            names = set(pq.read_schema(path).names)
+            return pd.read_parquet(path, columns=[c for c in columns if c in names])
+        except Exception as e:
+            print(f"⚠️ Parquet mirror unreadable, using {excel_file}: {e}")
+
+    if columns is None:
+        return read_workbook(excel_file)
+    wanted = set(columns)
+    return read_workbook(excel_file, usecols=lambda c: c in wanted)
+
+
+def read_log_tail(excel_file: str, n: int, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """
+    Load only the last n log rows.
+
+    Args:
+        excel_file: Path to the canonical workbook
+        n: Number of trailing rows to return
+        columns: Optional subset of columns to keep; unknown names are ignored
+
+    Returns:
+        DataFrame of at most n rows in file order
+    """
+    if fresh_parquet(excel_file) is None and load_workbook is not None:
+        try:
+            return _tail_workbook_rows(excel_file, n, columns)
+        except Exception as e:
+            print(f"⚠️ Streaming tail read failed for {excel_file}: {e}")
+    return read_log(excel_file, columns).tail(n).reset_index(drop=True)
+
+
+def _tail_workbook_rows(excel_file: str, n: int, columns: Optional[Sequence[str]]) -> pd.DataFrame:
+    """Build a DataFrame from the header and last n rows via openpyxl read-only mode."""
+    wb = load_workbook(excel_file, read_only=True, data_only=True)
+    try:
+        ws = wb.active
+        header = next(ws.iter_rows(max_row=1, values_only=True), None)
+        if header is None:
+            return pd.DataFrame()
+        last = ws.max_row
+        if last is None:
+            # No <dimension> tag: fall back to a bounded deque over every row
+            rows = list(deque(ws.iter_rows(min_row=2, values_only=True), maxlen=n))
+        else:
+            rows = list(ws.iter_rows(min_row=max(2, last - n + 1), max_row=last, values_only=True))
+    finally:
+        wb.close()
+    df = pd.DataFrame(rows, columns=list(header))
+    if columns is not None:
+        df = df[[c for c in columns if c in df.columns]]
+    return df
+
+
+def count_rows(excel_file: str) -> int:
+    """Count log rows without materializing the full sheet."""
+    counts = read_log_counts(excel_file)
+    if counts is not None:
+        return counts["total"]
+    path = fresh_parquet(excel_file)
+    if path is not None:
+        try:
+            return pq.ParquetFile(path).metadata.num_rows
+        except Exception as e:
+            print(f"⚠️ Parquet mirror unreadable, using {excel_file}: {e}")
+    if load_workbook is not None:
+        try:
+            return _count_workbook_rows(excel_file)
+        except Exception as e:
+            print(f"⚠️ Streaming row count failed for {excel_file}: {e}")
+    return len(read_workbook(excel_file, usecols=[0]))
+
+
+def _count_workbook_rows(excel_file: str) -> int:
+    """Data rows on the active sheet via openpyxl read-only mode (header excluded)."""
+    wb = load_workbook(excel_file, read_only=True, data_only=True)
+    try:
+        ws = wb.active
+        # The sheet's <dimension> tag gives the extent without reading rows
+        total = ws.max_row
+        if total is None:
+            total = sum(1 for _ in ws.iter_rows(values_only=True))
+        return max(total - 1, 0)
+    finally:
+        wb.close()
@@ -45,15 +45,20 @@ Version: 1.0.0
 License: MIT
 """
 
+import functools
 import os
 import sys
 import logging
+import queue
 import threading
 import time
-from datetime import datetime, timezone
-from typing import Optional, Dict, List, Tuple, Any
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
+from datetime import datetime
+from typing import Optional, Dict, FrozenSet, List, Tuple, Any, Union
 from contextlib import contextmanager
 from enum import Enum
+from types import MappingProxyType
 
 # Optional dependency - graceful fallback if not available
 try:
@@ -68,6 +73,16 @@ except ImportError:
 # CONFIGURATION
 # ============================================================================
 
+# Date stamp for the connector log file name, taken once at import
+_LOG_DATE = datetime.now().strftime('%Y%m%d')
+
+# Accepted spellings for boolean environment flags (compared lower-cased)
+_TRUTHY = frozenset(("1", "true", "yes"))
+
+# Attach to an already running terminal before launching one (read once, not per retry)
+_MT5_ATTACH_FIRST = os.getenv("MT5_ATTACH_FIRST", "1").strip().lower() in _TRUTHY
+
+
 class MT5Config:
     """Configuration container for MT5 connection parameters"""
     
@@ -94,26 +109,45 @@ class MT5Config:
             timeout: Operation timeout in milliseconds
             max_retries: Maximum number of connection retry attempts
             retry_delay: Delay between retry attempts in seconds
-            enable_health_check: Enable periodic connection health checks
+            enable_health_check: Enable connection health checks (run lazily, at most once per interval)
             health_check_interval: Interval between health checks in seconds
         """
-        self.login = login or int(os.getenv("MT5_LOGIN", "211744072"))
-        self.password = password or os.getenv("MT5_PASSWORD", "dFbKaNLWQ53@9@Z")
-        self.server = server or os.getenv("MT5_SERVER", "ExnessKE-MT5Trial9")
-        self.path = path or os.getenv("MT5_PATH", r"C:\Program Files\MetaTrader 5\terminal64.exe")
-        self.timeout = int(os.getenv("MT5_TIMEOUT_MS", str(timeout)))
-        self.max_retries = int(os.getenv("MT5_MAX_RETRIES", str(max_retries)))
-        self.retry_delay = float(os.getenv("MT5_RETRY_DELAY", str(retry_delay)))
-        self.enable_health_check = os.getenv("MT5_HEALTH_CHECK", "1").strip() in ("1", "true", "yes")
-        self.health_check_interval = int(os.getenv("MT5_HEALTH_CHECK_INTERVAL", str(health_check_interval)))
+        # Unset (or empty) variables fall through to the defaults without a str/int round trip
+        env = os.environ
+        self.login = login or int(env.get("MT5_LOGIN") or 211744072)
+        self.password = password or env.get("MT5_PASSWORD", "dFbKaNLWQ53@9@Z")
+        self.server = server or env.get("MT5_SERVER", "ExnessKE-MT5Trial9")
+        self.path = path or env.get("MT5_PATH", r"C:\Program Files\MetaTrader 5\terminal64.exe")
+        self.timeout = int(env.get("MT5_TIMEOUT_MS") or timeout)
+        self.max_retries = int(env.get("MT5_MAX_RETRIES") or max_retries)
+        self.retry_delay = float(env.get("MT5_RETRY_DELAY") or retry_delay)
+        self.enable_health_check = env.get("MT5_HEALTH_CHECK", "1").strip().lower() in _TRUTHY
+        self.health_check_interval = int(env.get("MT5_HEALTH_CHECK_INTERVAL") or health_check_interval)
+        
+        # Fields are not changed after construction, so validation runs once here
+        self._validation = self._validate_once()
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def from_env(cls) -> 'MT5Config':
+        """
+        Configuration built purely from environment variables and defaults
+        
+        Parsed once per process; every caller shares the same instance.
+        """
+        return cls()
     
     def validate(self) -> Tuple[bool, Optional[str]]:
         """
         Validate configuration parameters
         
         Returns:
-            Tuple of (is_valid, error_message)
+            Tuple of (is_valid, error_message), computed at construction
         """
+        return self._validation
+    
+    def _validate_once(self) -> Tuple[bool, Optional[str]]:
+        """Run the parameter checks behind validate()"""
         if not self.login or self.login == 0:
             return False, "Invalid MT5 login number"
         
@@ -182,9 +216,71 @@ class MT5NotAvailableError(MT5ConnectionError):
 # UTILITY FUNCTIONS
 # ============================================================================
 
+class _DaemonExecutor:
+    """
+    Fixed pool of daemon worker threads returning concurrent.futures.Future objects
+    
+    ThreadPoolExecutor joins its workers at interpreter exit, so one MT5 call that
+    never returns would hang the process on shutdown. Daemon workers do not.
+    """
+    
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self._max_workers = max_workers
+        self._thread_name_prefix = thread_name_prefix
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._threads: List[threading.Thread] = []
+        self._start_lock = threading.Lock()
+    
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """Queue fn(*args, **kwargs) and return its Future"""
+        if len(self._threads) < self._max_workers:
+            self._start_workers()
+        future: Future = Future()
+        self._queue.put((future, fn, args, kwargs))
+        return future
+    
+    def _start_workers(self):
+        with self._start_lock:
+            while len(self._threads) < self._max_workers:
+                thread = threading.Thread(
+                    target=self._worker,
+                    daemon=True,
+                    name=f"{self._thread_name_prefix}_{len(self._threads)}"
+                )
+                thread.start()
+                self._threads.append(thread)
+    
+    def _worker(self):
+        while True:
+            future, fn, args, kwargs = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+
+# Shared workers for timeout-protected MT5 calls (no thread start per call)
+_MT5_EXECUTOR = _DaemonExecutor(max_workers=4, thread_name_prefix="mt5")
+
+# How long a symbols_get() result is reused before asking the terminal again
+SYMBOLS_CACHE_TTL = 300  # seconds
+
+# Characters with a meaning inside a symbols_get() group mask
+_GROUP_MASK_CHARS = frozenset("*,!")
+
+# Resolved find_symbol names kept per connector (least recently used evicted first)
+SYMBOL_CACHE_MAX = 4096
+
+# symbols_get() group snapshots kept per connector; find_symbol adds one "*<symbol>*"
+# mask per distinct symbol, so the least recently used masks are evicted
+SYMBOL_GROUPS_MAX = 64
+
+
 def _call_with_timeout(fn, timeout_seconds: float, *args, **kwargs) -> Tuple[bool, Any, Optional[Exception]]:
     """
-    Execute a function with timeout protection using daemon thread
+    Execute a function with timeout protection on the shared MT5 worker pool
     
     Args:
         fn: Function to execute
@@ -195,24 +291,45 @@ def _call_with_timeout(fn, timeout_seconds: float, *args, **kwargs) -> Tuple[boo
     Returns:
         Tuple of (completed, result, error)
     """
-    result_container = {"done": False, "result": None, "error": None}
-    
-    def runner():
-        try:
-            result_container["result"] = fn(*args, **kwargs)
-        except Exception as exc:
-            result_container["error"] = exc
-        finally:
-            result_container["done"] = True
-    
-    thread = threading.Thread(target=runner, daemon=True)
-    thread.start()
-    thread.join(timeout_seconds)
-    
-    if not result_container["done"]:
+    future = _MT5_EXECUTOR.submit(fn, *args, **kwargs)
+    try:
+        return True, future.result(timeout=timeout_seconds), None
+    except FuturesTimeoutError:
+        # Drops the call if it is still queued; a running MT5 call cannot be interrupted
+        future.cancel()
         return False, None, MT5TimeoutError(f"Operation timed out after {timeout_seconds:.1f}s")
-    
-    return True, result_container["result"], result_container["error"]
+    except Exception as exc:
+        return True, None, exc
+
+
+@functools.lru_cache(maxsize=8)
+def _terminal_path_valid(path: Optional[str]) -> bool:
+    """True if path names an existing terminal; checked once per path per process"""
+    return bool(path) and os.path.exists(path)
+
+
+# Broker suffixes tried by find_symbol, most common first
+_SYMBOL_SUFFIXES = ("", "m", ".a", ".", ".raw")
+
+
+@functools.lru_cache(maxsize=256)
+def _symbol_variations(standard_symbol: str) -> Tuple[str, ...]:
+    """Default broker spellings of a normalized symbol, built once per symbol"""
+    return tuple(standard_symbol + suffix for suffix in _SYMBOL_SUFFIXES)
+
+
+@functools.lru_cache(maxsize=16)
+def _iso(timestamp: float) -> str:
+    """UTC ISO-8601 string for an epoch timestamp (same text as datetime.isoformat())"""
+    seconds = int(timestamp)
+    micros = round((timestamp - seconds) * 1e6)
+    if micros == 1000000:
+        seconds, micros = seconds + 1, 0
+    stamp = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+    # isoformat() drops the fraction entirely on whole seconds
+    if micros:
+        return f"{stamp}.{micros:06d}+00:00"
+    return f"{stamp}+00:00"
 
 
 def normalize_symbol(symbol: str) -> str:
@@ -250,7 +367,8 @@ class MT5Connector:
     """
     
     _instance: Optional['MT5Connector'] = None
-    _lock = threading.RLock()
+    # Plain Locks: neither is ever acquired twice by the same thread
+    _lock = threading.Lock()
     
     def __init__(self, config: Optional[MT5Config] = None):
         """
@@ -265,15 +383,27 @@ class MT5Connector:
                 "Install with: pip install MetaTrader5"
             )
         
-        self.config = config or MT5Config()
+        self.config = config or MT5Config.from_env()
+        # Read-only config summary shared by every get_connection_stats() result
+        self._config_view = MappingProxyType({
+            "login": self.config.login,
+            "server": self.config.server,
+            "timeout_ms": self.config.timeout,
+            "max_retries": self.config.max_retries
+        })
         self._state = ConnectionState.DISCONNECTED
-        self._connection_lock = threading.RLock()
-        self._symbol_cache: Dict[str, str] = {}
+        self._connection_lock = threading.Lock()
+        self._symbol_cache: 'OrderedDict[str, str]' = OrderedDict()
+        # group mask -> (fetched_at, names, frozenset(names)), LRU-bounded, guarded by _symbols_lock
+        self._symbols_by_group: 'OrderedDict[str, Tuple[float, Tuple[str, ...], FrozenSet[str]]]' = OrderedDict()
+        self._symbols_lock = threading.Lock()
+        # (names, upper-cased names) for the "*" snapshot, rebuilt when the snapshot changes
+        self._all_symbols_upper: Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]] = None
         self._last_health_check: float = 0
+        # time.monotonic() deadline for the next lazy health check
+        self._next_health_check: float = 0
         self._connection_time: Optional[float] = None
         self._connection_attempts: int = 0
-        self._health_check_thread: Optional[threading.Thread] = None
-        self._health_check_stop = threading.Event()
         
         # Setup logging
         self.logger = logging.getLogger(f"{__name__}.MT5Connector")
@@ -284,7 +414,7 @@ class MT5Connector:
         
         # Add file handler if not already present
         if not any(isinstance(h, logging.FileHandler) for h in self.logger.handlers):
-            log_file = os.path.join("logs", f"mt5_connector_{datetime.now().strftime('%Y%m%d')}.log")
+            log_file = os.path.join("logs", f"mt5_connector_{_LOG_DATE}.log")
             file_handler = logging.FileHandler(log_file, encoding="utf-8")
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(logging.Formatter(
@@ -311,24 +441,29 @@ class MT5Connector:
             All subsequent calls will return the same instance with the original config.
             Use reset_instance() first if you need to create with different config.
         """
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = cls(config)
-        else:
+        # Fast path: one class attribute read, no lock once the instance exists
+        inst = cls._instance
+        if inst is not None:
             # Warn if trying to use different config
             if config is not None:
-                existing_config = cls._instance.config
+                existing_config = inst.config
                 # Check if configs differ (basic check on key fields)
                 if (config.login != existing_config.login or 
                     config.server != existing_config.server):
-                    cls._instance.logger.warning(
+                    inst.logger.warning(
                         f"MT5Connector singleton already exists with different config! "
                         f"Existing: login={existing_config.login}, server={existing_config.server}. "
                         f"Requested: login={config.login}, server={config.server}. "
                         f"Using existing config. Call reset_instance() first if you need different config."
                     )
-        return cls._instance
+            return inst
+        
+        with cls._lock:
+            inst = cls._instance
+            if inst is None:
+                # Published only after __init__ has returned
+                inst = cls._instance = cls(config)
+        return inst
     
     @classmethod
     def reset_instance(cls):
@@ -364,7 +499,7 @@ class MT5Connector:
             # Disconnect if forcing reconnection
             if force_reconnect and self._state == ConnectionState.CONNECTED:
                 self.logger.info("Forcing reconnection...")
-                self.disconnect()
+                self._disconnect_locked()
             
             # Validate configuration
             is_valid, error_msg = self.config.validate()
@@ -408,10 +543,7 @@ class MT5Connector:
                     self._state = ConnectionState.CONNECTED
                     self._connection_time = time.time()
                     self._last_health_check = time.time()
-                    
-                    # Start health check thread if enabled
-                    if self.config.enable_health_check:
-                        self._start_health_check()
+                    self._next_health_check = time.monotonic() + self.config.health_check_interval
                     
                     self.logger.info(
                         f"Successfully connected to MT5 "
@@ -445,9 +577,7 @@ class MT5Connector:
         
         try:
             # Prefer attach-first approach (connect to already running terminal)
-            attach_first = os.getenv("MT5_ATTACH_FIRST", "1").strip() in ("1", "true", "yes")
-            
-            if attach_first:
+            if _MT5_ATTACH_FIRST:
                 # Try connecting to running terminal first
                 self.logger.debug("Attempting to attach to running MT5 terminal...")
                 completed, result, error = _call_with_timeout(
@@ -457,6 +587,7 @@ class MT5Connector:
                 
                 if not completed:
                     self.logger.warning("Attach timed out, trying with path...")
+                    self._release_timed_out_call()
                 elif error:
                     self.logger.warning(f"Attach failed: {error}, trying with path...")
                 elif result:
@@ -464,7 +595,7 @@ class MT5Connector:
                     return True
             
             # Try with explicit path
-            if self.config.path and os.path.exists(self.config.path):
+            if _terminal_path_valid(self.config.path):
                 self.logger.debug(f"Initializing with path: {self.config.path}")
                 completed, result, error = _call_with_timeout(
                     mt5.initialize,
@@ -474,6 +605,7 @@ class MT5Connector:
                 
                 if not completed:
                     self.logger.error("Initialization with path timed out")
+                    self._release_timed_out_call()
                     return False
                 
                 if error:
@@ -485,14 +617,16 @@ class MT5Connector:
                     return True
             
             # Last resort: try simple initialize again
-            if not attach_first:
+            if not _MT5_ATTACH_FIRST:
                 self.logger.debug("Attempting simple MT5 initialization...")
                 completed, result, error = _call_with_timeout(
                     mt5.initialize,
                     timeout_seconds=self.config.timeout / 1000.0
                 )
                 
-                if completed and not error and result:
+                if not completed:
+                    self._release_timed_out_call()
+                elif not error and result:
                     self.logger.info("Successfully initialized MT5")
                     return True
             
@@ -543,6 +677,16 @@ class MT5Connector:
             self.logger.exception(f"Exception during MT5 login: {e}")
             return False
     
+    def _release_timed_out_call(self):
+        """
+        Shut the terminal link down after a timed-out MT5 call
+        
+        A running MT5 call cannot be cancelled; shutdown() makes it return so
+        the pool worker it occupies is freed instead of blocking indefinitely.
+        """
+        self.logger.debug("Shutting down MT5 to release a timed-out call")
+        self._shutdown()
+    
     def _shutdown(self):
         """Shutdown MT5 connection"""
         try:
@@ -555,33 +699,41 @@ class MT5Connector:
     def disconnect(self):
         """Disconnect from MT5 terminal"""
         with self._connection_lock:
-            if self._state == ConnectionState.DISCONNECTED:
-                self.logger.debug("Already disconnected")
-                return
-            
-            # Stop health check thread
-            if self._health_check_thread is not None:
-                self._health_check_stop.set()
-                self._health_check_thread.join(timeout=5)
-                self._health_check_thread = None
-            
-            # Shutdown connection
-            self._shutdown()
-            
-            # Update state
-            self._state = ConnectionState.DISCONNECTED
-            self._connection_time = None
-            self._symbol_cache.clear()
-            
-            self.logger.info("Disconnected from MT5")
+            self._disconnect_locked()
+    
+    def _disconnect_locked(self):
+        """Disconnect; the caller must hold _connection_lock"""
+        if self._state == ConnectionState.DISCONNECTED:
+            self.logger.debug("Already disconnected")
+            return
+        
+        # Shutdown connection
+        self._shutdown()
+        
+        # Update state
+        self._state = ConnectionState.DISCONNECTED
+        self._connection_time = None
+        self._symbol_cache.clear()
+        with self._symbols_lock:
+            self._symbols_by_group.clear()
+            self._all_symbols_upper = None
+        
+        self.logger.info("Disconnected from MT5")
     
     def is_connected(self) -> bool:
         """
         Check if currently connected to MT5
         
+        Runs the health check first when it is due (see _verify_connection);
+        a failed check marks the connection as failed, it does not reconnect.
+        
         Returns:
             True if connected, False otherwise
         """
+        if self._state != ConnectionState.CONNECTED:
+            return False
+        if self.config.enable_health_check and time.monotonic() >= self._next_health_check:
+            self._verify_connection()
         return self._state == ConnectionState.CONNECTED
     
     def get_state(self) -> ConnectionState:
@@ -597,30 +749,34 @@ class MT5Connector:
     # HEALTH CHECKS
     # ========================================================================
     
-    def _start_health_check(self):
-        """Start background health check thread"""
-        if self._health_check_thread is not None and self._health_check_thread.is_alive():
-            return
+    def _verify_connection(self):
+        """Health check on demand (no background thread); failures leave reconnecting to connect()"""
+        # Move the deadline first so concurrent callers don't all run the check
+        self._next_health_check = time.monotonic() + self.config.health_check_interval
         
-        self._health_check_stop.clear()
-        self._health_check_thread = threading.Thread(
-            target=self._health_check_loop,
-            daemon=True,
-            name="MT5HealthCheck"
-        )
-        self._health_check_thread.start()
-        self.logger.debug("Health check thread started")
+        connected_at = self._connection_time
+        if not self.health_check() and self._mark_failed(connected_at):
+            self.logger.warning("Health check failed, marking connection as failed (connect() will reconnect)")
     
-    def _health_check_loop(self):
-        """Background health check loop"""
-        while not self._health_check_stop.wait(self.config.health_check_interval):
-            try:
-                if self._state == ConnectionState.CONNECTED:
-                    if not self.health_check():
-                        self.logger.warning("Health check failed, attempting reconnection...")
-                        self.connect(force_reconnect=True)
-            except Exception as e:
-                self.logger.exception(f"Error in health check loop: {e}")
+    def _mark_failed(self, connected_at: Optional[float]) -> bool:
+        """
+        Set ERROR if the connection that failed (identified by its connect time) is still current
+        
+        Never blocks: a connect()/disconnect() holding _connection_lock, possibly in this
+        very thread, settles the state itself.
+        
+        Returns:
+            True if the state was changed
+        """
+        if not self._connection_lock.acquire(blocking=False):
+            return False
+        try:
+            if self._state != ConnectionState.CONNECTED or self._connection_time != connected_at:
+                return False
+            self._state = ConnectionState.ERROR
+            return True
+        finally:
+            self._connection_lock.release()
     
     def health_check(self) -> bool:
         """
@@ -631,53 +787,127 @@ class MT5Connector:
         """
         if self._state != ConnectionState.CONNECTED:
             return False
+        connected_at = self._connection_time
         
-        try:
-            # Try to get account info as health check
-            account_info = mt5.account_info()
-            if account_info is None:
-                self.logger.warning("Health check failed: account_info returned None")
-                return False
-            
-            self._last_health_check = time.time()
-            self.logger.debug("Health check passed")
-            return True
+        # Try to get account info as health check, bounded like every other terminal call
+        completed, account_info, error = _call_with_timeout(
+            mt5.account_info,
+            timeout_seconds=self.config.timeout / 1000.0
+        )
+        if not completed:
+            self.logger.error(f"Health check timed out after {self.config.timeout}ms, marking connection as failed")
+            self._mark_failed(connected_at)
+            self._release_timed_out_call()
+            return False
         
-        except Exception as e:
-            self.logger.error(f"Health check failed with exception: {e}")
+        if error:
+            self.logger.error(f"Health check failed with exception: {error}")
             return False
+        
+        if account_info is None:
+            self.logger.warning("Health check failed: account_info returned None")
+            return False
+        
+        self._last_health_check = time.time()
+        self._next_health_check = time.monotonic() + self.config.health_check_interval
+        self.logger.debug("Health check passed")
+        return True
     
     # ========================================================================
     # SYMBOL MANAGEMENT
     # ========================================================================
     
-    def get_available_symbols(self, group: str = "*") -> List[str]:
+    def get_available_symbols(self, group: str = "*", as_set: bool = False) -> Union[List[str], FrozenSet[str]]:
         """
         Get list of available symbols
         
+        Results are cached per group for SYMBOLS_CACHE_TTL seconds.
+        
         Args:
             group: Symbol group filter (default: all symbols)
+            as_set: Return the shared frozenset of names (for membership tests)
         
         Returns:
-            List of symbol names
+            List of symbol names, or a frozenset when as_set is True
         """
         if not self.is_connected():
             self.logger.warning("Cannot get symbols - not connected to MT5")
-            return []
+            return frozenset() if as_set else []
         
-        try:
-            symbols = mt5.symbols_get(group=group)
-            if symbols is None:
-                self.logger.warning("No symbols returned from MT5")
-                return []
-            
-            symbol_names = [s.name for s in symbols]
-            self.logger.debug(f"Retrieved {len(symbol_names)} symbols")
-            return symbol_names
+        cached = self._symbol_names(group)
+        if cached is None:
+            return frozenset() if as_set else []
+        names, name_set = cached
+        return name_set if as_set else list(names)
+    
+    def _symbol_names(self, group: str) -> Optional[Tuple[Tuple[str, ...], FrozenSet[str]]]:
+        """(names, frozenset(names)) for a group mask, fetched at most once per SYMBOLS_CACHE_TTL"""
+        now = time.monotonic()
+        with self._symbols_lock:
+            cached = self._symbols_by_group.get(group)
+            if cached is not None:
+                self._symbols_by_group.move_to_end(group)
+        if cached is not None and now - cached[0] < SYMBOLS_CACHE_TTL:
+            return cached[1], cached[2]
         
-        except Exception as e:
-            self.logger.error(f"Error getting symbols: {e}")
-            return []
+        # symbols_get can stall on a wedged terminal; bound it like initialize/login
+        connected_at = self._connection_time
+        completed, symbols, error = _call_with_timeout(
+            mt5.symbols_get,
+            timeout_seconds=self.config.timeout / 1000.0,
+            group=group
+        )
+        if not completed:
+            self.logger.error(f"symbols_get timed out after {self.config.timeout}ms, marking connection as failed")
+            self._mark_failed(connected_at)
+            self._release_timed_out_call()
+            return None
+        
+        if error:
+            self.logger.error(f"Error getting symbols: {error}")
+            return None
+        
+        if symbols is None:
+            self.logger.warning("No symbols returned from MT5")
+            return None
+        
+        names = tuple(s.name for s in symbols)
+        name_set = frozenset(names)
+        with self._symbols_lock:
+            self._symbols_by_group[group] = (now, names, name_set)
+            self._symbols_by_group.move_to_end(group)
+            if len(self._symbols_by_group) > SYMBOL_GROUPS_MAX:
+                self._symbols_by_group.popitem(last=False)
+        self.logger.debug(f"Retrieved {len(names)} symbols")
+        return names, name_set
+    
+    def _all_symbol_names(self) -> Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]]:
+        """(names, upper-cased names) of every symbol, sharing the "*" TTL snapshot"""
+        cached = self._symbol_names("*")
+        if cached is None:
+            return None
+        names = cached[0]
+        entry = self._all_symbols_upper
+        if entry is None or entry[0] is not names:
+            entry = (names, tuple(name.upper() for name in names))
+            self._all_symbols_upper = entry
+        return entry
+    
+    def _cached_symbol(self, key: str) -> Optional[str]:
+        """LRU lookup in _symbol_cache (None on a miss)"""
+        cached = self._symbol_cache.get(key)
+        if cached is not None:
+            try:
+                self._symbol_cache.move_to_end(key)
+            except KeyError:
+                pass  # evicted by another thread in between
+        return cached
+    
+    def _cache_symbol(self, key: str, value: str):
+        """Insert into _symbol_cache, evicting the least recently used entry when full"""
+        if key not in self._symbol_cache and len(self._symbol_cache) >= SYMBOL_CACHE_MAX:
+            self._symbol_cache.popitem(last=False)
+        self._symbol_cache[key] = value
     
     def find_symbol(self, standard_symbol: str, variations: Optional[List[str]] = None) -> Optional[str]:
         """
@@ -694,47 +924,71 @@ class MT5Connector:
             self.logger.warning("Cannot find symbol - not connected to MT5")
             return None
         
+        # Check cache under the caller's spelling first: hits skip normalization
+        requested = standard_symbol
+        cached = self._cached_symbol(requested)
+        if cached is not None:
+            return cached
+        
         # Normalize input
         standard_symbol = normalize_symbol(standard_symbol)
         
         # Check cache
-        if standard_symbol in self._symbol_cache:
-            cached = self._symbol_cache[standard_symbol]
-            self.logger.debug(f"Using cached symbol: {standard_symbol} -> {cached}")
+        cached = self._cached_symbol(standard_symbol)
+        if cached is not None:
+            self._cache_symbol(requested, cached)
             return cached
         
         # Default variations if not provided
         if variations is None:
-            variations = [
-                standard_symbol,
-                f"{standard_symbol}m",
-                f"{standard_symbol}.a",
-                f"{standard_symbol}.",
-                f"{standard_symbol}.raw"
-            ]
+            variations = _symbol_variations(standard_symbol)
         
         self.logger.debug(f"Searching for {standard_symbol} (trying {len(variations)} variations)")
         
-        # Try each variation
-        for variant in variations:
-            try:
-                symbol_info = mt5.symbol_info(variant)
-                if symbol_info is not None:
+        # One masked symbols_get answers every variation containing the symbol plus the
+        # fuzzy search; other variations (e.g. GOLD for XAUUSD) still need symbol_info
+        masked = None
+        if standard_symbol and not _GROUP_MASK_CHARS.intersection(standard_symbol):
+            masked = self._symbol_names(f"*{standard_symbol}*")
+        if masked is not None and masked[0]:
+            names, name_set = masked
+            for variant in variations:
+                if variant in name_set or (
+                    standard_symbol not in variant.upper() and self._symbol_exists(variant)
+                ):
                     self.logger.info(f"Found symbol: {standard_symbol} -> {variant}")
-                    self._symbol_cache[standard_symbol] = variant
+                    self._cache_symbol(standard_symbol, variant)
+                    self._cache_symbol(requested, variant)
                     return variant
-            except Exception as e:
-                self.logger.debug(f"Error checking variant {variant}: {e}")
+            best_match = next((name for name in names if standard_symbol in name.upper()), None)
+            if best_match is not None:
+                self.logger.info(f"Fuzzy match found: {standard_symbol} -> {best_match}")
+                self._cache_symbol(standard_symbol, best_match)
+                self._cache_symbol(requested, best_match)
+                return best_match
+            self.logger.warning(f"Could not find symbol: {standard_symbol}")
+            return None
         
-        # Try fuzzy search
+        # Mask unavailable or empty: try each variation
+        for variant in variations:
+            if self._symbol_exists(variant):
+                self.logger.info(f"Found symbol: {standard_symbol} -> {variant}")
+                self._cache_symbol(standard_symbol, variant)
+                self._cache_symbol(requested, variant)
+                return variant
+        
+        # Try fuzzy search over the cached snapshot (no symbols_get round trip while fresh)
         try:
-            all_symbols = mt5.symbols_get()
+            all_symbols = self._all_symbol_names()
             if all_symbols:
-                matches = [s.name for s in all_symbols if standard_symbol in s.name.upper()]
-                if matches:
-                    best_match = matches[0]
+                names, upper_names = all_symbols
+                best_match = next(
+                    (name for name, upper in zip(names, upper_names) if standard_symbol in upper), None
+                )
+                if best_match is not None:
                     self.logger.info(f"Fuzzy match found: {standard_symbol} -> {best_match}")
-                    self._symbol_cache[standard_symbol] = best_match
+                    self._cache_symbol(standard_symbol, best_match)
+                    self._cache_symbol(requested, best_match)
                     return best_match
         except Exception as e:
             self.logger.error(f"Error in fuzzy symbol search: {e}")
@@ -742,6 +996,14 @@ class MT5Connector:
         self.logger.warning(f"Could not find symbol: {standard_symbol}")
         return None
     
+    def _symbol_exists(self, symbol: str) -> bool:
+        """True if symbol_info() knows the symbol (one terminal round trip)"""
+        try:
+            return mt5.symbol_info(symbol) is not None
+        except Exception as e:
+            self.logger.debug(f"Error checking variant {symbol}: {e}")
+            return False
+    
     def get_symbol_info(self, symbol: str) -> Optional[Any]:
         """
         Get detailed information about a symbol
@@ -852,33 +1114,31 @@ class MT5Connector:
         Get connection statistics and diagnostics
         
         Returns:
-            Dictionary with connection statistics
+            Dictionary with connection statistics ("config" is a shared read-only mapping)
+        
+        Reads the current state only; never runs a health check or talks to the terminal.
         """
+        state = self._state
         uptime = None
         if self._connection_time is not None:
             uptime = time.time() - self._connection_time
         
         return {
-            "state": self._state.value,
-            "connected": self.is_connected(),
-            "connection_time": datetime.fromtimestamp(self._connection_time, tz=timezone.utc).isoformat() 
-                              if self._connection_time else None,
+            "state": state.value,
+            "connected": state == ConnectionState.CONNECTED,
+            "connection_time": _iso(self._connection_time) if self._connection_time else None,
             "uptime_seconds": uptime,
             "connection_attempts": self._connection_attempts,
-            "last_health_check": datetime.fromtimestamp(self._last_health_check, tz=timezone.utc).isoformat()
-                                if self._last_health_check > 0 else None,
+            "last_health_check": _iso(self._last_health_check) if self._last_health_check > 0 else None,
             "cached_symbols": len(self._symbol_cache),
-            "config": {
-                "login": self.config.login,
-                "server": self.config.server,
-                "timeout_ms": self.config.timeout,
-                "max_retries": self.config.max_retries
-            }
+            "config": self._config_view
         }
     
     def __repr__(self) -> str:
-        return (f"MT5Connector(state={self._state.value}, "
-                f"connected={self.is_connected()}, "
+        # No is_connected(): a repr must not trigger a health check
+        state = self._state
+        return (f"MT5Connector(state={state.value}, "
+                f"connected={state == ConnectionState.CONNECTED}, "
                 f"server={self.config.server})")
 
 
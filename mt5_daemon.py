@@ -0,0 +1,220 @@
+"""
+mt5_daemon.py - Shared MT5 Symbol Daemon
+========================================
+
+Initializing the MT5 terminal takes seconds, and list_mt5_symbols.py used to
+pay that on every run. This daemon connects once through MT5Connector and
+answers symbol queries over a local socket (a named pipe on Windows), so later
+runs only pay one round trip per query.
+
+Requests and replies are length-prefixed JSON frames:
+
+    {"op": "ping"}                           -> {"ok": true, "result": true}
+    {"op": "symbols_get", "group": "*USD*"}  -> {"ok": true, "result": ["EURUSD", ...]}
+    {"op": "symbol_info", "name": "EURUSD"}  -> {"ok": true, "result": {...} or null}
+
+Usage:
+------
+    python mt5_daemon.py             # keep running; Ctrl+C to stop
+    
+    from mt5_daemon import DaemonClient
+    client = DaemonClient.connect()  # None when no daemon is running
+
+Author: Trading Bot Team
+Version: 1.0.0
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+from multiprocessing.connection import Client, Listener
+from types import SimpleNamespace
+from typing import Any, Dict, FrozenSet, List, Optional, Union
+
+from mt5_connector import MT5Connector
+
+# orjson emits the same JSON text several times faster; peers without it still interoperate
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Named pipe on Windows, Unix domain socket elsewhere
+if sys.platform == "win32":
+    DAEMON_FAMILY = "AF_PIPE"
+    DAEMON_ADDRESS = os.getenv("MT5_DAEMON_ADDRESS", r"\\.\pipe\mt5_symbols")
+else:
+    DAEMON_FAMILY = "AF_UNIX"
+    DAEMON_ADDRESS = os.getenv("MT5_DAEMON_ADDRESS", "/tmp/mt5_symbols.sock")
+
+# Seconds a client waits for a reply before giving up on the daemon
+DAEMON_TIMEOUT = 30.0
+
+logger = logging.getLogger(__name__)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode one frame payload"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Decode one frame payload"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# ============================================================================
+# SERVER
+# ============================================================================
+
+def _symbol_info_dict(info: Any) -> Optional[Dict[str, Any]]:
+    """SymbolInfo as a plain dict (None passes through)"""
+    if info is None:
+        return None
+    if hasattr(info, "_asdict"):
+        return dict(info._asdict())
+    return {
+        attr: getattr(info, attr) for attr in dir(info)
+        if not attr.startswith("_") and not callable(getattr(info, attr))
+    }
+
+
+def handle_request(connector: MT5Connector, request: Dict[str, Any]) -> Dict[str, Any]:
+    """Answer one decoded request; never raises"""
+    op = request.get("op")
+    try:
+        if op == "ping":
+            return {"ok": True, "result": connector.is_connected() or connector.connect()}
+        if op == "symbols_get":
+            return {"ok": True, "result": connector.get_available_symbols(request.get("group") or "*")}
+        if op == "symbol_info":
+            return {"ok": True, "result": _symbol_info_dict(connector.get_symbol_info(request["name"]))}
+        return {"ok": False, "error": f"unknown op: {op!r}"}
+    except Exception as e:
+        logger.error(f"Error handling {op!r}: {e}")
+        return {"ok": False, "error": str(e)}
+
+
+def _serve_client(conn, connector: MT5Connector):
+    """Answer requests on one client connection until it closes"""
+    try:
+        while True:
+            try:
+                request = _loads(conn.recv_bytes())
+            except EOFError:
+                return
+            except ValueError as e:
+                conn.send_bytes(_dumps({"ok": False, "error": f"bad request: {e}"}))
+                continue
+            conn.send_bytes(_dumps(handle_request(connector, request)))
+    except OSError as e:
+        logger.debug(f"Client connection dropped: {e}")
+    finally:
+        conn.close()
+
+
+def serve(address: str = DAEMON_ADDRESS, connector: Optional[MT5Connector] = None):
+    """Connect to MT5 once and serve symbol queries until interrupted"""
+    if DaemonClient.connect(address) is not None:
+        print(f"⚠️ An MT5 daemon is already listening on {address}")
+        return
+    
+    if connector is None:
+        connector = MT5Connector.get_instance()
+    if not connector.connect():
+        print("❌ MT5 connection failed, daemon not started")
+        return
+    
+    # A socket file left behind by a crashed daemon would make bind() fail
+    if DAEMON_FAMILY == "AF_UNIX" and os.path.exists(address):
+        os.unlink(address)
+    
+    listener = Listener(address, family=DAEMON_FAMILY)
+    print(f"✅ MT5 daemon listening on {address} (Ctrl+C to stop)")
+    try:
+        while True:
+            try:
+                conn = listener.accept()
+            except OSError as e:
+                logger.warning(f"Accept failed: {e}")
+                continue
+            threading.Thread(
+                target=_serve_client, args=(conn, connector),
+                name="MT5DaemonClient", daemon=True
+            ).start()
+    except KeyboardInterrupt:
+        print("\n🛑 Stopping MT5 daemon")
+    finally:
+        listener.close()
+        connector.disconnect()
+
+
+# ============================================================================
+# CLIENT
+# ============================================================================
+
+class DaemonClient:
+    """
+    Connector stand-in that forwards symbol queries to a running daemon
+    
+    Implements the subset of MT5Connector used by list_mt5_symbols.py.
+    """
+    
+    def __init__(self, conn):
+        self._conn = conn
+        # One request in flight per connection; callers may share the client across threads
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def connect(cls, address: Optional[str] = None) -> Optional['DaemonClient']:
+        """Return a client for a daemon with a live MT5 connection, or None"""
+        try:
+            conn = Client(address or DAEMON_ADDRESS, family=DAEMON_FAMILY)
+        except OSError:
+            return None
+        client = cls(conn)
+        if client._request({"op": "ping"}) is not True:
+            client.disconnect()
+            return None
+        return client
+    
+    def _request(self, request: Dict[str, Any]) -> Any:
+        """Send one request and return its result (None on any failure)"""
+        try:
+            with self._lock:
+                self._conn.send_bytes(_dumps(request))
+                if not self._conn.poll(DAEMON_TIMEOUT):
+                    raise TimeoutError(f"no reply within {DAEMON_TIMEOUT}s")
+                reply = _loads(self._conn.recv_bytes())
+        except (OSError, EOFError, ValueError) as e:
+            logger.warning(f"MT5 daemon request {request.get('op')!r} failed: {e}")
+            return None
+        if not reply.get("ok"):
+            logger.warning(f"MT5 daemon error: {reply.get('error')}")
+            return None
+        return reply.get("result")
+    
+    def get_available_symbols(self, group: str = "*", as_set: bool = False) -> Union[List[str], FrozenSet[str]]:
+        """Symbol names for a group mask, as a list or a frozenset"""
+        names = self._request({"op": "symbols_get", "group": group}) or []
+        return frozenset(names) if as_set else names
+    
+    def get_symbol_info(self, symbol: str) -> Optional[Any]:
+        """SymbolInfo-like object with attribute access, or None if not found"""
+        info = self._request({"op": "symbol_info", "name": symbol})
+        return SimpleNamespace(**info) if info is not None else None
+    
+    def disconnect(self):
+        """Close this client's connection; the daemon keeps MT5 open"""
+        self._conn.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    serve()
@@ -5,6 +5,8 @@ import pandas as pd
 import traceback
 from typing import Dict, Optional
 
+from log_store import write_log_mirror
+
 # Try to import reportlab components (optional dependency)
 try:
     from reportlab.lib.pagesizes import A4
@@ -393,6 +395,7 @@ class ReportGenerator:
 
             # Save to Excel
             df_combined.to_excel(self.excel_file, index=False, engine='openpyxl')
+            write_log_mirror(df_combined, self.excel_file)
             print(f"✅ Excel Log updated: {self.excel_file}")
             
         except Exception as e:
@@ -3,8 +3,10 @@ Status Monitor - Real-time Application Event Tracking
 Tracks all data fetches, operations, failures, and successes
 """
 
+from collections import deque
 from datetime import datetime
-from typing import List, Dict, Optional
+from itertools import islice
+from typing import Deque, List, Dict, Optional
 from enum import Enum
 import threading
 
@@ -63,8 +65,9 @@ class StatusMonitor:
             return
         
         self._initialized = True
-        self.events: List[StatusEvent] = []
         self.max_events = 500  # Keep last 500 events
+        # Bounded deque: appends past max_events drop the oldest entry in O(1)
+        self.events: Deque[StatusEvent] = deque(maxlen=self.max_events)
         self.stats = {
             'total_events': 0,
             'successes': 0,
@@ -94,10 +97,6 @@ class StatusMonitor:
                 self.stats['data_fetches'] += 1
             elif event_type == EventType.ANALYSIS:
                 self.stats['analyses'] += 1
-            
-            # Trim old events if needed
-            if len(self.events) > self.max_events:
-                self.events = self.events[-self.max_events:]
     
     def log_info(self, message: str, details: Optional[str] = None):
         """Log an info event"""
@@ -134,8 +133,7 @@ class StatusMonitor:
     def get_recent_events(self, count: int = 100) -> List[Dict]:
         """Get recent events as dictionaries"""
         with self._event_lock:
-            recent = self.events[-count:] if len(self.events) > count else self.events
-            return [event.to_dict() for event in reversed(recent)]
+            return [event.to_dict() for event in islice(reversed(self.events), count)]
     
     def get_stats(self) -> Dict:
         """Get current statistics"""
@@ -154,19 +152,34 @@ class StatusMonitor:
                 'data_fetches': 0,
                 'analyses': 0
             }
-            self.log_event(EventType.CACHE, "Status Monitor cleared")
+        # Outside the lock: log_event takes it again and the lock is not reentrant
+        self.log_event(EventType.CACHE, "Status Monitor cleared")
     
     def get_filtered_events(self, event_type: Optional[EventType] = None, 
                            count: int = 100) -> List[Dict]:
-        """Get filtered events by type"""
+        """Get up to count events of a type, newest first (filters before slicing, stops at count)"""
+        if event_type is None:
+            return self.get_recent_events(count)
         with self._event_lock:
-            if event_type is None:
-                return self.get_recent_events(count)
-            
-            filtered = [e for e in self.events if e.event_type == event_type]
-            recent = filtered[-count:] if len(filtered) > count else filtered
-            return [event.to_dict() for event in reversed(recent)]
-
+            matches = (e for e in reversed(self.events) if e.event_type == event_type)
+            return [event.to_dict() for event in islice(matches, count)]
+    
+    def get_filtered_events_columnar(self, event_type: Optional[EventType] = None,
+                                     count: int = 100) -> Dict[str, List[str]]:
+        """Get filtered events newest first as one list per field (timestamp/type/message/details)"""
+        columns = {'timestamp': [], 'type': [], 'message': [], 'details': []}
+        timestamps, types = columns['timestamp'], columns['type']
+        messages, details = columns['message'], columns['details']
+        with self._event_lock:
+            matches = reversed(self.events)
+            if event_type is not None:
+                matches = (e for e in matches if e.event_type == event_type)
+            for event in islice(matches, count):
+                timestamps.append(event.timestamp.strftime('%H:%M:%S.%f')[:-3])
+                types.append(event.event_type.value)
+                messages.append(event.message)
+                details.append(event.details or "")
+        return columns
 
 # Global instance
 _monitor = StatusMonitor()
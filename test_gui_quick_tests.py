@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for the System Status quick tests in gui.py
+=================================================
+
+Drives run_quick_tests() ("🚀 Run All Tests") with a stub dashboard, so no
+MetaTrader 5 terminal or Streamlit server is needed.
+
+Usage:
+    python -m pytest -q test_gui_quick_tests.py
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+try:
+    import gui
+except ImportError as e:  # gui imports verifier, which requires MetaTrader5
+    pytest.skip(f"gui unavailable: {e}", allow_module_level=True)
+
+
+class StubDataManager:
+    """connect() and the bar fetch, recording the order they are called in"""
+
+    def __init__(self, can_connect=True, bars=48):
+        self.can_connect = can_connect
+        self.bars = bars
+        self.connected = False
+        self.calls = []
+
+    def connect(self):
+        self.calls.append("connect")
+        self.connected = self.can_connect
+        return self.connected
+
+    def fetch_ohlcv_for_timeframe(self, symbol, timeframe, lookback_days):
+        self.calls.append("fetch")
+        # Like the real DataManager, no bars without a connection
+        if not self.connected:
+            return None
+        return pd.DataFrame({"close": range(self.bars)})
+
+
+def make_dashboard(**kwargs):
+    return SimpleNamespace(symbols=["GBPUSD"], data_manager=StubDataManager(**kwargs))
+
+
+@pytest.fixture
+def excel_file(tmp_path):
+    return str(tmp_path / "sentiment_log.xlsx")
+
+
+def test_data_probe_runs_after_connect(excel_file):
+    dashboard = make_dashboard()
+    results = gui.run_quick_tests(dashboard, {"enabled": True, "connected": False},
+                                  {excel_file: (True, True)}, excel_file)
+
+    assert dashboard.data_manager.calls == ["connect", "fetch"]
+    assert results == {
+        "mt5": ("success", "✅ Connected"),
+        "data": ("success", "✅ Got 48 bars"),
+        "files": ("success", "✅ All OK"),
+    }
+
+
+def test_failed_connect(excel_file):
+    dashboard = make_dashboard(can_connect=False)
+    results = gui.run_quick_tests(dashboard, {"enabled": True, "connected": False}, {}, excel_file)
+
+    assert results["mt5"] == ("error", "❌ Failed")
+    assert results["data"] == ("error", "❌ No data")
+    assert results["files"] == ("warning", f"⚠️ Issues: {excel_file} missing")
+
+
+def test_exception_becomes_error_result(excel_file, monkeypatch):
+    def boom(dashboard):
+        raise RuntimeError("terminal gone")
+
+    monkeypatch.setattr(gui, "quick_test_data", boom)
+    results = gui.run_quick_tests(make_dashboard(), {"enabled": True, "connected": False},
+                                  {excel_file: (True, True)}, excel_file)
+
+    assert results["mt5"] == ("success", "✅ Connected")
+    assert results["data"] == ("error", "❌ terminal gone")
+    assert results["files"] == ("success", "✅ All OK")
+
+
+def test_file_check_overlaps_mt5_test(excel_file, monkeypatch):
+    # The file check waits for the MT5 test to start; run in series this would time out
+    mt5_started = threading.Event()
+    real_mt5 = gui.quick_test_mt5
+
+    def quick_test_mt5(dashboard, status):
+        mt5_started.set()
+        return real_mt5(dashboard, status)
+
+    def quick_test_files(path_access, excel_file):
+        return ("success", "overlapped") if mt5_started.wait(5) else ("error", "ran alone")
+
+    monkeypatch.setattr(gui, "quick_test_mt5", quick_test_mt5)
+    monkeypatch.setattr(gui, "quick_test_files", quick_test_files)
+    results = gui.run_quick_tests(make_dashboard(), {"enabled": True, "connected": True}, {}, excel_file)
+
+    assert results["mt5"] == ("success", "✅ MT5 already connected")
+    assert results["files"] == ("success", "overlapped")
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for log_store.py
+======================
+
+Covers the freshness rules for the Parquet mirror and counts sidecar, the
+streaming tail read, the count_rows fallback chain and the calamine fallback.
+
+Usage:
+    python -m pytest -q test_log_store.py
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+import log_store
+
+
+def make_log(rows: int) -> pd.DataFrame:
+    """Sentiment-log shaped frame with rows entries"""
+    return pd.DataFrame({
+        "Timestamp": [f"2024-01-01 00:{i % 60:02d}" for i in range(rows)],
+        "Symbol": ["GBPUSD" if i % 2 else "XAUUSD" for i in range(rows)],
+        "Final Bias": ["Bullish" if i % 3 else "Bearish" for i in range(rows)],
+        "Confidence": [i / 10 for i in range(rows)],
+        "Verified": ["✅ True" if i % 4 == 0 else "❌ False" if i % 4 == 1 else "Pending" for i in range(rows)],
+    })
+
+
+def set_mtime(path, mtime: float) -> None:
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    """A 25-row workbook with no mirror or sidecar"""
+    path = str(tmp_path / "sentiment_log.xlsx")
+    make_log(25).to_excel(path, index=False)
+    return path
+
+
+def test_stale_mirror_is_ignored(workbook):
+    log_store.write_log_mirror(make_log(25), workbook)
+    assert log_store.fresh_parquet(workbook) == log_store.parquet_path(workbook)
+
+    # The workbook is edited after the mirror was written
+    make_log(30).to_excel(workbook, index=False)
+    mirror_mtime = os.stat(log_store.parquet_path(workbook)).st_mtime
+    set_mtime(workbook, mirror_mtime + 10)
+
+    assert log_store.fresh_parquet(workbook) is None
+    assert len(log_store.read_log(workbook)) == 30
+
+
+def test_fresh_mirror_is_used(workbook):
+    log_store.write_log_mirror(make_log(40), workbook)
+    set_mtime(workbook, os.stat(log_store.parquet_path(workbook)).st_mtime - 10)
+
+    # Served from the mirror, which deliberately disagrees with the workbook
+    assert len(log_store.read_log(workbook)) == 40
+    assert list(log_store.read_log(workbook, ["Symbol", "Missing"]).columns) == ["Symbol"]
+
+
+def test_sidecar_older_than_workbook_is_ignored(workbook):
+    log_store.write_log_counts(make_log(99), workbook)
+    set_mtime(workbook, os.stat(log_store.counts_path(workbook)).st_mtime + 10)
+
+    assert log_store.read_log_counts(workbook) is None
+    assert log_store.count_rows(workbook) == 25
+
+
+def test_sidecar_counts(workbook):
+    log_store.write_log_counts(make_log(25), workbook)
+    set_mtime(workbook, os.stat(log_store.counts_path(workbook)).st_mtime - 10)
+
+    assert log_store.read_log_counts(workbook) == {"total": 25, "verified": 13, "correct": 7}
+
+
+@pytest.mark.parametrize("n", [1, 5, 25, 100])
+def test_read_log_tail_matches_read_excel(workbook, n):
+    expected = pd.read_excel(workbook).tail(n).reset_index(drop=True)
+    pd.testing.assert_frame_equal(log_store.read_log_tail(workbook, n), expected)
+
+    columns = ["Symbol", "Confidence"]
+    pd.testing.assert_frame_equal(log_store.read_log_tail(workbook, n, columns), expected[columns])
+
+
+def test_read_log_tail_without_dimension(workbook, monkeypatch):
+    # No <dimension> tag: the bounded deque over every row takes over
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+    monkeypatch.setattr(ReadOnlyWorksheet, "max_row", property(lambda self: None))
+
+    expected = pd.read_excel(workbook).tail(7).reset_index(drop=True)
+    pd.testing.assert_frame_equal(log_store._tail_workbook_rows(workbook, 7, None), expected)
+
+
+def test_count_rows_fallback_order(workbook, monkeypatch):
+    # Sidecar, mirror and workbook deliberately disagree so each source is identifiable
+    log_store.write_log_mirror(make_log(12), workbook)
+    log_store.write_log_counts(make_log(11), workbook)
+    set_mtime(workbook, os.stat(log_store.counts_path(workbook)).st_mtime - 10)
+
+    # 1. Fresh sidecar wins
+    assert log_store.count_rows(workbook) == 11
+
+    # 2. Parquet footer
+    os.remove(log_store.counts_path(workbook))
+    assert log_store.count_rows(workbook) == 12
+
+    # 3. openpyxl streaming count
+    os.remove(log_store.parquet_path(workbook))
+    assert log_store.count_rows(workbook) == 25
+
+    # 4. pandas when openpyxl's streaming reader is unavailable
+    monkeypatch.setattr(log_store, "load_workbook", None)
+    assert log_store.count_rows(workbook) == 25
+
+
+def test_calamine_falls_back_to_openpyxl(workbook, monkeypatch):
+    real_read_excel = pd.read_excel
+    engines = []
+
+    def read_excel(path, engine=None, **kwargs):
+        engines.append(engine)
+        if engine == "calamine":
+            raise ImportError("Missing optional dependency 'python-calamine'")
+        return real_read_excel(path, engine=engine, **kwargs)
+
+    monkeypatch.setattr(log_store, "EXCEL_ENGINE", "calamine")
+    monkeypatch.setattr(pd, "read_excel", read_excel)
+
+    df = log_store.read_workbook(workbook, usecols=["Symbol"])
+    assert engines == ["calamine", None]
+    pd.testing.assert_frame_equal(df, real_read_excel(workbook, usecols=["Symbol"]))
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Tests for mt5_daemon.py
+=======================
+
+Round-trips every op through a real daemon on a temporary Unix socket, backed
+by a stub connector so no MetaTrader 5 terminal is needed.
+
+Usage:
+    python -m pytest -q test_mt5_daemon.py
+"""
+
+import fnmatch
+import socket
+import sys
+import threading
+import time
+from collections import namedtuple
+
+import pytest
+
+import mt5_daemon
+from mt5_daemon import DaemonClient
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses an AF_UNIX socket")
+
+SymbolInfo = namedtuple("SymbolInfo", "name description digits visible")
+
+
+class StubConnector:
+    """The MT5Connector methods the daemon calls, over a fixed symbol list"""
+
+    SYMBOLS = {
+        "EURUSDm": SymbolInfo("EURUSDm", "Euro vs US Dollar", 5, True),
+        "GBPUSDm": SymbolInfo("GBPUSDm", "Pound vs US Dollar", 5, True),
+        "XAUUSDm": SymbolInfo("XAUUSDm", "Gold vs US Dollar", 3, False),
+        "BTCJPY": SymbolInfo("BTCJPY", "Bitcoin vs Yen", 0, True),
+    }
+
+    def __init__(self, connected=True, can_connect=True):
+        self.connected = connected
+        self.can_connect = can_connect
+
+    def is_connected(self):
+        return self.connected
+
+    def connect(self):
+        self.connected = self.can_connect
+        return self.connected
+
+    def disconnect(self):
+        self.connected = False
+
+    def get_available_symbols(self, group="*"):
+        return [name for name in self.SYMBOLS if fnmatch.fnmatchcase(name, group)]
+
+    def get_symbol_info(self, symbol):
+        return self.SYMBOLS.get(symbol)
+
+
+def start_daemon(address, connector):
+    """Run serve() on a background thread and wait until it accepts clients"""
+    threading.Thread(target=mt5_daemon.serve, args=(address, connector), daemon=True).start()
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        client = DaemonClient.connect(address)
+        if client is not None:
+            return client
+        time.sleep(0.05)
+    pytest.fail("daemon did not start")
+
+
+@pytest.fixture
+def address(tmp_path):
+    return str(tmp_path / "mt5_symbols.sock")
+
+
+@pytest.fixture
+def client(address):
+    client = start_daemon(address, StubConnector())
+    yield client
+    client.disconnect()
+
+
+def test_ping(client):
+    assert client._request({"op": "ping"}) is True
+
+
+def test_symbols_get(client):
+    assert client.get_available_symbols() == list(StubConnector.SYMBOLS)
+    assert client.get_available_symbols(group="*USD*") == ["EURUSDm", "GBPUSDm", "XAUUSDm"]
+    assert client.get_available_symbols(group="*USD*", as_set=True) == frozenset(
+        {"EURUSDm", "GBPUSDm", "XAUUSDm"}
+    )
+    assert client.get_available_symbols(group="NOPE*") == []
+
+
+def test_symbol_info(client):
+    info = client.get_symbol_info("XAUUSDm")
+    assert (info.name, info.description, info.digits, info.visible) == ("XAUUSDm", "Gold vs US Dollar", 3, False)
+    assert client.get_symbol_info("UNKNOWN") is None
+
+
+def test_unknown_op(client):
+    assert client._request({"op": "order_send"}) is None
+    # The connection stays usable after an error reply
+    assert client._request({"op": "ping"}) is True
+
+
+def test_client_shared_across_threads(client):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(client.get_symbol_info("EURUSDm").name))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == ["EURUSDm"] * 8
+
+
+def test_no_daemon_listening(address):
+    assert DaemonClient.connect(address) is None
+
+
+def test_stale_socket_file(address):
+    # A socket file left by a crashed daemon: connect is refused, the caller falls back
+    sock = socket.socket(socket.AF_UNIX)
+    sock.bind(address)
+    sock.close()
+    assert DaemonClient.connect(address) is None
+
+
+def test_daemon_without_mt5_is_skipped(address):
+    # The daemon answers, but its terminal is down and cannot reconnect
+    connector = StubConnector()
+    client = start_daemon(address, connector)
+    client.disconnect()
+    connector.connected = connector.can_connect = False
+    assert DaemonClient.connect(address) is None
+
+
+def test_list_mt5_symbols_prefers_daemon(address, monkeypatch):
+    lm = pytest.importorskip("list_mt5_symbols")
+    client = start_daemon(address, StubConnector())
+    client.disconnect()
+
+    monkeypatch.setattr(mt5_daemon, "DAEMON_ADDRESS", address)
+    monkeypatch.setattr(lm, "_SYMBOLS_CACHE", {})
+    success, connector = lm.connect_mt5()
+    try:
+        assert success and isinstance(connector, DaemonClient)
+        assert [s.name for s in lm.find_matching_symbols("gbp", connector)] == ["GBPUSDm"]
+    finally:
+        connector.disconnect()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for status_monitor.py
+===========================
+
+Checks that the columnar event view agrees with the row view the GUI used to
+build its table from, and that the event history stays bounded.
+
+Usage:
+    python -m pytest -q test_status_monitor.py
+"""
+
+import pytest
+
+from status_monitor import EventType, get_monitor
+
+
+@pytest.fixture
+def monitor():
+    """The shared monitor, emptied before and after each test"""
+    monitor = get_monitor()
+    monitor.clear()
+    yield monitor
+    monitor.clear()
+
+
+def log_mixed(monitor, rounds: int) -> None:
+    """Log rounds events of each of three types, interleaved"""
+    for i in range(rounds):
+        monitor.log_success(f"fetched {i}")
+        monitor.log_error(f"failed {i}", details=f"attempt {i}")
+        monitor.log_data_fetch(f"bars {i}")
+
+
+def as_columns(rows):
+    """get_filtered_events() rows pivoted into get_filtered_events_columnar() shape"""
+    return {key: [row[key] for row in rows] for key in ("timestamp", "type", "message", "details")}
+
+
+@pytest.mark.parametrize("event_type", [None, EventType.ERROR, EventType.DATA_FETCH, EventType.CONNECTION])
+@pytest.mark.parametrize("count", [0, 1, 5, 40, 1000])
+def test_columnar_matches_rows(monitor, event_type, count):
+    log_mixed(monitor, 30)
+    rows = monitor.get_filtered_events(event_type, count)
+    assert monitor.get_filtered_events_columnar(event_type, count) == as_columns(rows)
+
+
+def test_filtered_newest_first(monitor):
+    log_mixed(monitor, 10)
+    columns = monitor.get_filtered_events_columnar(EventType.ERROR, 3)
+    assert columns["message"] == ["failed 9", "failed 8", "failed 7"]
+    assert columns["details"] == ["attempt 9", "attempt 8", "attempt 7"]
+    assert set(columns["type"]) == {EventType.ERROR.value}
+
+
+def test_events_capped_at_max_events(monitor):
+    assert monitor.max_events == 500
+    log_mixed(monitor, 300)
+
+    assert len(monitor.events) == 500
+    # The oldest events were dropped, the newest kept; stats still count everything
+    assert monitor.events[-1].message == "bars 299"
+    assert monitor.events[0].message == "failed 133"
+    assert monitor.get_stats()["total_events"] == 901
+    assert len(monitor.get_filtered_events(count=1000)) == 500
@@ -18,6 +18,10 @@ except ImportError as e:
 
 # Import centralized symbol utilities
 from symbol_utils import normalize_symbol
+from log_store import write_log_mirror
+
+# Lower-cased "Verified" values that mark a prediction as not yet verified
+PENDING_VALUES = frozenset({"", "pending"})
 
 class Verifier:
     def __init__(self, excel_file="sentiment_log.xlsx", mt5_login=None, 
@@ -84,7 +88,8 @@ class Verifier:
                 return None
                 
             # Filter pending verifications
-            pending_mask = df["Verified"].isin(["Pending", "pending", "PENDING", None, ""])
+            verified = df["Verified"].astype("string").str.lower()
+            pending_mask = verified.isna() | verified.isin(PENDING_VALUES)
             pending = df[pending_mask].copy()
             
             if pending.empty:
@@ -306,6 +311,7 @@ class Verifier:
         # Save updated DataFrame
         try:
             df.to_excel(self.excel_file, index=False)
+            write_log_mirror(df, self.excel_file)
             print(f"\n{'='*60}")
             print(f"✅ Verification complete!")
             print(f"   Verified: {verified_count}")